@@ -1,7 +1,10 @@
 # src/main.py
+import sys
 import uvicorn
+import anyio
 
 from fastapi import FastAPI, Depends
+from fastapi.responses import ORJSONResponse
 from src.api.middleware.cors import setup_cors
 from contextlib import asynccontextmanager
 from sqlalchemy.orm import Session
@@ -9,6 +12,7 @@ from sqlalchemy import text
 
 from src.api.routes import games_router, agents_router, news_router
 from src.api.middleware.error_handler import setup_exception_handlers
+from src.api.middleware.db_session import setup_db_session
 from src.config import settings
 from src.utils.logger import logger
 from src.infrastructure.database.session import get_db
@@ -16,9 +20,13 @@ from src.infrastructure.database.session import get_db
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 啟動事件
+    # 同步路由（DB 與 LLM 呼叫皆為阻塞 I/O）跑在 AnyIO 執行緒池中，預設上限僅 40 條，
+    # 一場遊戲回合會佔住執行緒數秒，因此依設定放大上限
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.app_threadpool_size
     logger.info("API 服務啟動中", extra={
         "environment": settings.app_env,
-        "port": settings.app_port
+        "port": settings.app_port,
+        "threadpool_size": settings.app_threadpool_size
     })
     yield
     # 關閉事件
@@ -29,7 +37,9 @@ app = FastAPI(
     title="Sustainet-Inc API",
     description="Sustainet Inc. 的 API 服務",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # 以 orjson 序列化回應，比標準庫 json 快許多
+    default_response_class=ORJSONResponse
 )
 
 # 設定 CORS
@@ -38,6 +48,9 @@ setup_cors(app)
 # 設定全局異常處理
 setup_exception_handlers(app)
 
+# 設定請求範圍資料庫 Session
+setup_db_session(app)
+
 # 加載 API 路由
 app.include_router(games_router, prefix="/api")
 app.include_router(agents_router, prefix="/api")
@@ -64,4 +77,24 @@ def health_check(db: Session = Depends(get_db)):
     }
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=settings.app_port, reload=True)
\ No newline at end of file
+    # uvloop 不支援 Windows，其餘平台改用 uvloop + httptools 取代預設的 asyncio 事件迴圈
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    if settings.is_production:
+        # 正式環境關閉 reload，啟動多個 worker 行程以使用所有 CPU 核心
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=settings.app_port,
+            workers=settings.app_workers,
+            loop=loop,
+            http="httptools"
+        )
+    else:
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=settings.app_port,
+            reload=True,
+            loop=loop,
+            http="httptools"
+        )
@@ -2,5 +2,6 @@
 
 from .cors import setup_cors
 from .error_handler import setup_exception_handlers
+from .db_session import setup_db_session
 
-__all__ = ["setup_cors", "setup_exception_handlers"]
+__all__ = ["setup_cors", "setup_exception_handlers", "setup_db_session"]
@@ -0,0 +1,61 @@
+"""
+請求範圍資料庫 Session 中間件。
+為每個 HTTP 請求建立 ScopedSession 範圍，並在請求結束時統一提交或回滾後釋放。
+"""
+import anyio
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.database.session import (
+    ScopedSession,
+    next_request_scope,
+    request_scope,
+)
+
+
+class DBSessionMiddleware:
+    """
+    純 ASGI 中間件，管理 ScopedSession 的生命週期。
+    
+    - 請求開始時設定 request_scope，讓同一請求內的 ScopedSession() 取得同一個 session
+    - 送出回應標頭前：狀態碼 < 400 則提交，否則回滾（與 get_db 的提交時機一致，
+      客戶端收到成功回應時資料已寫入）
+    - 請求結束後呼叫 ScopedSession.remove() 關閉 session 並歸還連線
+    
+    請求中未使用 ScopedSession 時不會建立任何 session。
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_scope.set(next_request_scope())
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and ScopedSession.registry.has():
+                session = ScopedSession()
+                if message["status"] < 400:
+                    await anyio.to_thread.run_sync(session.commit)
+                else:
+                    await anyio.to_thread.run_sync(session.rollback)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if ScopedSession.registry.has():
+                await anyio.to_thread.run_sync(ScopedSession.remove)
+            request_scope.reset(token)
+
+
+def setup_db_session(app: FastAPI) -> None:
+    """
+    設定請求範圍資料庫 Session 中間件。
+    
+    Args:
+        app: FastAPI 應用實例
+    """
+    app.add_middleware(DBSessionMiddleware)
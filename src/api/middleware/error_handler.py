@@ -5,7 +5,7 @@
 將各種異常轉換為標準格式的 HTTP 響應。
 """
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException
 from typing import Any, Dict, Optional, Union, Type
@@ -82,6 +82,30 @@ class ServerError(APIError):
         super().__init__(message, status_code=500, error_code=error_code, details=details)
 
 
+def http_error_response(status_code: int, message: str) -> ORJSONResponse:
+    """
+    直接建立與 http_exception_handler 相同格式的錯誤響應。
+    
+    用於路由中可預期的失敗（如依名稱查無 Agent），省去拋出 HTTPException
+    與異常處理器分派的成本。這些 404/400 路徑刻意不記錄日誌；非預期的錯誤
+    不應以此回傳，須讓異常傳到全域處理器，以記錄日誌與 traceback。
+    
+    參數:
+        status_code: HTTP 狀態碼
+        message: 錯誤訊息
+    """
+    return ORJSONResponse(
+        status_code=status_code,
+        content={
+            "success": False,
+            "error": {
+                "code": f"HTTP_{status_code}",
+                "message": message,
+            }
+        }
+    )
+
+
 def setup_exception_handlers(app):
     """
     設定 FastAPI 應用程序的異常處理器
@@ -265,5 +289,6 @@ __all__ = [
     'ConflictError',
     'APIValidationError',
     'ServerError',
+    'http_error_response',
     'setup_exception_handlers',
 ]
@@ -3,7 +3,7 @@ Agent 相關的 API 路由。
 提供 Agent CRUD 操作的 HTTP 端點。
 """
 from typing import Dict, Any, Optional
-from fastapi import APIRouter, Depends, Path, HTTPException, status
+from fastapi import APIRouter, Depends, Path, Response, status
 from pydantic import BaseModel
 
 from src.application.dto.agent_dto import (
@@ -12,19 +12,15 @@ from src.application.dto.agent_dto import (
     AgentResponse,
     AgentListResponse
 )
-from src.api.routes.base import get_agent_service
+from src.api.routes.base import ORJSONRoute, get_agent_service, get_agent_factory
 from src.utils.exceptions import ResourceNotFoundError, BusinessLogicError
+from src.api.middleware.error_handler import http_error_response
 from src.application.services.agent_service import AgentService
 from src.domain.logic.agent_factory import AgentFactory
-from src.infrastructure.database.agent_repo import AgentRepository
 
 router = APIRouter(prefix="/agents", 
-                   tags=["agents"])
-
-# 依賴注入
-def get_agent_factory() -> AgentFactory:
-    """獲取 AgentFactory 服務實例"""
-    return AgentFactory(AgentRepository())
+                   tags=["agents"],
+                   route_class=ORJSONRoute)
 
 class TestAgentRequest(BaseModel):
     """測試 Agent 的請求 DTO"""
@@ -58,7 +54,8 @@ def list_agents(
     """
     獲取所有 Agent 列表。
     """
-    return service.list_agents()
+    # 服務層已快取序列化結果，直接回傳 JSON bytes
+    return Response(content=service.list_agents_json(), media_type="application/json")
 
 @router.get("/{agent_id}", response_model=AgentResponse)
 def get_agent(
@@ -73,10 +70,7 @@ def get_agent(
     try:
         return service.get_agent(agent_id)
     except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+        return http_error_response(status.HTTP_404_NOT_FOUND, str(e))
 
 @router.get("/by-name/{agent_name}", response_model=AgentResponse)
 def get_agent_by_name(
@@ -90,10 +84,7 @@ def get_agent_by_name(
     """
     agent = service.get_agent_by_name(agent_name)
     if not agent:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent with name '{agent_name}' not found"
-        )
+        return http_error_response(status.HTTP_404_NOT_FOUND, f"Agent with name '{agent_name}' not found")
     return agent
 
 @router.put("/{agent_id}", response_model=AgentResponse)
@@ -110,10 +101,7 @@ def update_agent(
     try:
         return service.update_agent(agent_id, request)
     except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+        return http_error_response(status.HTTP_404_NOT_FOUND, str(e))
 
 @router.delete("/{agent_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_agent(
@@ -128,10 +116,7 @@ def delete_agent(
     try:
         service.delete_agent(agent_id)
     except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+        return http_error_response(status.HTTP_404_NOT_FOUND, str(e))
     return None
 
 @router.post("/test", response_model=TestAgentResponse)
@@ -153,17 +138,6 @@ def test_agent(
         )
         return TestAgentResponse(result=result)
     except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+        return http_error_response(status.HTTP_404_NOT_FOUND, str(e))
     except BusinessLogicError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"測試 Agent 時發生錯誤: {str(e)}"
-        )
+        return http_error_response(status.HTTP_400_BAD_REQUEST, str(e))
@@ -5,15 +5,17 @@ API 基礎路由設定模組。
 - 資料庫會話管理
 - 統一的服務層依賴注入
 - 基礎路由類別
+- 以 orjson 解析請求主體的路由類別
 """
 from typing import Callable, Type, TypeVar, Generic, Dict, Any, Optional
 from functools import lru_cache
 
-from fastapi import Depends
-from fastapi.routing import APIRouter
+import orjson
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute, APIRouter
 from sqlalchemy.orm import Session
 
-from src.infrastructure.database.session import get_db
+from src.infrastructure.database.session import ScopedSession, get_db
 
 # 用於定義服務類型
 ServiceType = TypeVar('ServiceType')
@@ -21,6 +23,31 @@ ServiceType = TypeVar('ServiceType')
 # 用於模型類型
 T = TypeVar('T')
 
+
+class ORJSONRequest(Request):
+    """
+    以 orjson 解析 JSON 主體的 Request。
+    orjson.JSONDecodeError 繼承自 json.JSONDecodeError，FastAPI 的 422 錯誤處理不受影響。
+    """
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    將請求包裝為 ORJSONRequest 的路由類別，搭配 APIRouter(route_class=ORJSONRoute) 使用。
+    """
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            request = ORJSONRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return orjson_route_handler
+
 class BaseRouter(Generic[ServiceType]):
     """
     基礎路由類別，用於抽象化常見的路由操作。
@@ -61,7 +88,7 @@ class BaseRouter(Generic[ServiceType]):
         self.prefix = prefix
         self.tags = tags
         self.service_class = service_class
-        self.router = APIRouter(prefix=prefix, tags=tags)
+        self.router = APIRouter(prefix=prefix, tags=tags, route_class=ORJSONRoute)
     
     def get_service(self, db: Session = Depends(get_db)) -> ServiceType:
         """
@@ -128,29 +155,50 @@ from src.infrastructure.database.tool_repo import ToolRepository
 from src.infrastructure.database.tool_usage_repo import ToolUsageRepository
 from src.infrastructure.database.article_polish_record_repo import ArticlePolishRecordRepository
 
+# 無狀態的 repository 與 AgentFactory 於模組載入時建立一次，供所有請求共用
+_SETUP_REPO = GameSetupRepository()
+_STATE_REPO = PlatformStateRepository()
+_NEWS_REPO = NewsRepository()
+_ACTION_REPO = ActionRecordRepository()
+_ROUND_REPO = GameRoundRepository()
+_TOOL_REPO = ToolRepository()
+_TOOL_USAGE_REPO = ToolUsageRepository()
+_POLISH_REPO = ArticlePolishRecordRepository()
+_AGENT_FACTORY = AgentFactory(AgentRepository())
+
 
-def get_agent_service(db: Session = Depends(get_db)) -> AgentService:
-    """獲取 Agent 服務實例"""
-    return AgentService(db=db)
+def get_agent_service() -> AgentService:
+    """
+    獲取 Agent 服務實例。
+    
+    使用請求範圍的 ScopedSession，提交與釋放由 DBSessionMiddleware 統一處理。
+    """
+    return AgentService(db=ScopedSession())
 
 def get_news_service(db: Session = Depends(get_db)) -> NewsService:
     """獲取 News 服務實例"""
     return NewsService(db=db)
 
-def get_agent_factory(db: Session = Depends(get_db)) -> AgentFactory:
-    """獲取 AgentFactory 實例"""
-    return AgentFactory(AgentRepository())
+def get_agent_factory() -> AgentFactory:
+    """獲取共用的 AgentFactory 實例"""
+    return _AGENT_FACTORY
+
+@lru_cache(maxsize=None)
+def get_game_service() -> GameService:
+    """
+    獲取 GameService 實例。
 
-def get_game_service(db: Session = Depends(get_db), agent_factory: AgentFactory = Depends(get_agent_factory)) -> GameService:
-    """獲取 GameService 實例"""
+    GameService 與其下的 repository 皆不持有 session 等請求狀態，
+    因此只在第一次呼叫時建立，之後的請求共用同一個實例。
+    """
     return GameService(
-        setup_repo=GameSetupRepository(),
-        state_repo=PlatformStateRepository(),
-        news_repo=NewsRepository(),
-        action_repo=ActionRecordRepository(),
-        round_repo=GameRoundRepository(),
-        tool_repo=ToolRepository(),
-        tool_usage_repo=ToolUsageRepository(),
-        agent_factory=agent_factory,
-        polish_repo=ArticlePolishRecordRepository()
+        setup_repo=_SETUP_REPO,
+        state_repo=_STATE_REPO,
+        news_repo=_NEWS_REPO,
+        action_repo=_ACTION_REPO,
+        round_repo=_ROUND_REPO,
+        tool_repo=_TOOL_REPO,
+        tool_usage_repo=_TOOL_USAGE_REPO,
+        agent_factory=_AGENT_FACTORY,
+        polish_repo=_POLISH_REPO
     )
@@ -3,7 +3,8 @@ Game 相關的 API 路由。
 提供遊戲初始化與回合管理的 HTTP 端點。
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Response, status
+from pydantic import BaseModel
 from src.application.services.game_service import GameService
 from src.application.dto.game_dto import ( 
     NewsPolishRequest, NewsPolishResponse,
@@ -14,10 +15,23 @@ from src.application.dto.game_dto import (
     GameDashboardRequest, GameDashboardResponse
     )
 from src.utils.exceptions import ResourceNotFoundError, BusinessLogicError
-from src.api.routes.base import get_game_service
+from src.api.middleware.error_handler import http_error_response
+from src.api.routes.base import ORJSONRoute, get_game_service
 
 # 建立路由器
-router = APIRouter(prefix="/games", tags=["games"])
+router = APIRouter(prefix="/games", tags=["games"], route_class=ORJSONRoute)
+
+
+def _json_response(response: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    回應由服務層以已驗證資料組成，直接序列化回傳以略過 FastAPI 對 response_model 的重複驗證。
+    以 model_dump_json 由 pydantic-core 直接產生 JSON，不先轉成 dict 再編碼。
+    """
+    return Response(
+        content=response.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
 
 
 @router.post("/start", response_model=GameStartResponse, status_code=status.HTTP_201_CREATED)
@@ -41,21 +55,13 @@ def start_game(service: GameService = Depends(get_game_service)):
     不需傳入任何 body，直接送 POST 請求即可。
     """
     try:
-        return service.start_game()
+        return _json_response(service.start_game(), status_code=status.HTTP_201_CREATED)
     except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"遊戲初始化時發生錯誤: {str(e)}"
-        )
+        return http_error_response(status.HTTP_404_NOT_FOUND, str(e))
 
 
 @router.post("/polish-news", response_model=NewsPolishResponse)
-def polish_news(
+async def polish_news(
     request: NewsPolishRequest,
     service: GameService = Depends(get_game_service)
 ):
@@ -73,22 +79,11 @@ def polish_news(
     """
     try:
         # 使用服務層進行潤稿
-        return service.polish_news(request)
+        return _json_response(await service.polish_news(request))
     except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+        return http_error_response(status.HTTP_404_NOT_FOUND, str(e))
     except BusinessLogicError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"潤稿過程發生錯誤: {str(e)}"
-        )
+        return http_error_response(status.HTTP_400_BAD_REQUEST, str(e))
         
 @router.post("/ai-turn", response_model=AiTurnResponse)
 def ai_turn(
@@ -118,22 +113,11 @@ def ai_turn(
     * 請確保 session_id 與 round_number 有對應的遊戲狀態，否則會回 404。
     """
     try:
-        return service.ai_turn(request)
+        return _json_response(service.ai_turn(request))
     except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+        return http_error_response(status.HTTP_404_NOT_FOUND, str(e))
     except BusinessLogicError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"AI 回合過程發生錯誤: {str(e)}"
-        )
+        return http_error_response(status.HTTP_400_BAD_REQUEST, str(e))
 
 @router.post("/player-turn", response_model=PlayerTurnResponse)
 def player_turn(
@@ -179,22 +163,11 @@ def player_turn(
     欄位如未使用可設為 null 或留空，後端會自動處理。
     """
     try:
-        return service.player_turn(request)
+        return _json_response(service.player_turn(request))
     except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+        return http_error_response(status.HTTP_404_NOT_FOUND, str(e))
     except BusinessLogicError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"玩家回合過程發生錯誤: {str(e)}"
-        )
+        return http_error_response(status.HTTP_400_BAD_REQUEST, str(e))
 
 @router.post("/next-round", response_model=StartNextRoundResponse)
 def start_next_round(
@@ -225,22 +198,11 @@ def start_next_round(
     """
 
     try:
-        return service.start_next_round(request)
+        return _json_response(service.start_next_round(request))
     except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+        return http_error_response(status.HTTP_404_NOT_FOUND, str(e))
     except BusinessLogicError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"切換回合過程發生錯誤: {str(e)}"
-            )
+        return http_error_response(status.HTTP_400_BAD_REQUEST, str(e))
 
 # @router.get("/dashboard/{session_id}", response_model=GameDashboardResponse)
 # def get_game_dashboard(
@@ -14,11 +14,11 @@ from src.application.dto.news_dto import (
     NewsBatchCreate,
     NewsBatchResponse
 )
-from src.api.routes.base import get_news_service
+from src.api.routes.base import ORJSONRoute, get_news_service
 from src.application.services.news_service import NewsService
 from src.utils.exceptions import ResourceNotFoundError, ValidationError
 
-router = APIRouter(prefix="/news", tags=["news"])
+router = APIRouter(prefix="/news", tags=["news"], route_class=ORJSONRoute)
 
 @router.post("", response_model=NewsResponse, status_code=status.HTTP_201_CREATED)
 def create_news(
@@ -3,7 +3,7 @@ Agent 相關的 DTO (Data Transfer Objects)。
 用於 API 請求與響應的資料結構定義。
 """
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class AgentCreateRequest(BaseModel):
     """建立 Agent 的請求 DTO。"""
@@ -21,25 +21,24 @@ class AgentCreateRequest(BaseModel):
     markdown: Optional[bool] = Field(default=True, description="是否支援 Markdown")
     debug: Optional[bool] = Field(default=False, description="是否啟用調試模式")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "agent_name": "TestAgent",
-                "provider": "openai",
-                "model_name": "gpt-4.1",
-                "instruction": "這是指令設定",
-                "tools": {
-                    "tools": [
-                        {
-                            "name": "",
-                            "params": {}
-                        }
-                    ]
-                },
-                "markdown": True,
-                "debug": False
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "agent_name": "TestAgent",
+            "provider": "openai",
+            "model_name": "gpt-4.1",
+            "instruction": "這是指令設定",
+            "tools": {
+                "tools": [
+                    {
+                        "name": "",
+                        "params": {}
+                    }
+                ]
+            },
+            "markdown": True,
+            "debug": False
         }
+    })
 
 class AgentUpdateRequest(BaseModel):
     """更新 Agent 的請求 DTO。"""
@@ -57,24 +56,23 @@ class AgentUpdateRequest(BaseModel):
     markdown: Optional[bool] = Field(default=True, description="是否支援 Markdown")
     debug: Optional[bool] = Field(default=False, description="是否啟用調試模式")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "provider": "openai",
-                "model_name": "gpt-4.1",
-                "instruction": "這是指令設定",
-                "tools": {
-                    "tools": [
-                        {
-                            "name": "",
-                            "params": {}
-                        }
-                    ]
-                },
-                "markdown": True,
-                "debug": False
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "provider": "openai",
+            "model_name": "gpt-4.1",
+            "instruction": "這是指令設定",
+            "tools": {
+                "tools": [
+                    {
+                        "name": "",
+                        "params": {}
+                    }
+                ]
+            },
+            "markdown": True,
+            "debug": False
         }
+    })
 
 class AgentResponse(BaseModel):
     """Agent 響應 DTO。"""
@@ -88,6 +86,8 @@ class AgentResponse(BaseModel):
     created_at: str
     updated_at: str
 
+    model_config = ConfigDict(frozen=True)
+
 class AgentListResponse(BaseModel):
     """Agent 列表響應 DTO。"""
     agents: List[AgentResponse]
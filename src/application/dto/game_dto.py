@@ -4,7 +4,7 @@ Game 相關的 DTO (Data Transfer Objects)。
 """
 
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # ========== 通用資料物件 ==========
 
@@ -19,19 +19,19 @@ class PlatformStatus(BaseModel):
     ai_trust: Optional[int] = Field(None, description="AI 在此平台的信任值（0-100）")
     spread_rate: Optional[int] = Field(None, description="此平台的訊息傳播率（例如 65 表示 65%）")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "session_id": "game_001",
-                "round_number": 1,
-                "platform_name": "Facebook",
-                "player_trust": 53,
-                "ai_trust": 67,
-                "spread_rate": 62
-            }
-            }
+    model_config = ConfigDict(frozen=True, json_schema_extra={
+        "example": {
+            "session_id": "game_001",
+            "round_number": 1,
+            "platform_name": "Facebook",
+            "player_trust": 53,
+            "ai_trust": 67,
+            "spread_rate": 62
+        }
+    })
 
 # ========== Dashboard ==========
+# 面板 API 尚未開放，相關 DTO 以 defer_build 延後至首次使用時才建構 schema
 
 class GameDashboardRequest(BaseModel):
     """
@@ -39,6 +39,8 @@ class GameDashboardRequest(BaseModel):
     """
     session_id: str = Field(..., description="遊戲識別碼")
 
+    model_config = ConfigDict(defer_build=True)
+
 class CurrentRoundInfo(BaseModel):
     """
     當前回合資訊
@@ -50,39 +52,38 @@ class CurrentRoundInfo(BaseModel):
     ai_impact: Optional[Dict[str, Any]] = Field(None, description="AI影響評估")
     clarification_effect: Optional[Dict[str, Any]] = Field(None, description="澄清效果")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "round_number": 3,
-                "ai_news": {
-                    "title": "據說新再生能源其實會導致更多空汙，研究顯示…",
-                    "content": "在新的研究中發現...",
-                    "platform": "Instagram",
-                    "category": "能源環保"
-                },
-                "player_response": {
-                    "content": "實際上，太陽能與風力造成的污染極低，資料來自能源署。",
-                    "tools_used": ["引用權威"]
-                },
-                "social_reactions": [
-                    "假的啦，再生能源明明比石化好 (質疑)",
-                    "我也有看到這個，真的假的 (疑惑)",
-                    "怎麼沒有主流媒體報？ (質疑)"
-                ],
-                "ai_impact": {
-                    "reach_count": 390,
-                    "spread_change": "+15%",
-                    "trust_change": "-10 點 (從 50 降至 40)",
-                    "effectiveness": "高傳播，因情緒性語句 + 無來源"
-                },
-                "clarification_effect": {
-                    "tool_bonus": "信任度 +5",
-                    "final_effectiveness": "中度有效",
-                    "reach_count": 120,
-                    "trust_change": "+16 點 (從 40 升至 56)"
-                }
+    model_config = ConfigDict(defer_build=True, json_schema_extra={
+        "example": {
+            "round_number": 3,
+            "ai_news": {
+                "title": "據說新再生能源其實會導致更多空汙，研究顯示…",
+                "content": "在新的研究中發現...",
+                "platform": "Instagram",
+                "category": "能源環保"
+            },
+            "player_response": {
+                "content": "實際上，太陽能與風力造成的污染極低，資料來自能源署。",
+                "tools_used": ["引用權威"]
+            },
+            "social_reactions": [
+                "假的啦，再生能源明明比石化好 (質疑)",
+                "我也有看到這個，真的假的 (疑惑)",
+                "怎麼沒有主流媒體報？ (質疑)"
+            ],
+            "ai_impact": {
+                "reach_count": 390,
+                "spread_change": "+15%",
+                "trust_change": "-10 點 (從 50 降至 40)",
+                "effectiveness": "高傳播，因情緒性語句 + 無來源"
+            },
+            "clarification_effect": {
+                "tool_bonus": "信任度 +5",
+                "final_effectiveness": "中度有效",
+                "reach_count": 120,
+                "trust_change": "+16 點 (從 40 升至 56)"
             }
         }
+    })
 
 class PlatformDashboardStatus(BaseModel):
     """
@@ -94,16 +95,15 @@ class PlatformDashboardStatus(BaseModel):
     spread_rate: int = Field(..., description="傳播率")
     trust_trend: str = Field(..., description="信任度趋势", example="↗")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "platform_name": "Instagram",
-                "player_trust": 56,
-                "ai_trust": 40,
-                "spread_rate": 75,
-                "trust_trend": "↗"
-            }
+    model_config = ConfigDict(defer_build=True, json_schema_extra={
+        "example": {
+            "platform_name": "Instagram",
+            "player_trust": 56,
+            "ai_trust": 40,
+            "spread_rate": 75,
+            "trust_trend": "↗"
         }
+    })
 
 class GameDashboardResponse(BaseModel):
     """
@@ -115,42 +115,41 @@ class GameDashboardResponse(BaseModel):
     game_progress: Dict[str, Any] = Field(..., description="遊戲進度")
     game_end_info: Optional[Dict[str, Any]] = Field(None, description="遊戲結束資訊（如果已結束）")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "session_id": "game_123",
-                "current_round": {
-                    "round_number": 3,
-                    "ai_news": {
-                        "title": "據說新再生能源其實會導致更多空汙",
-                        "platform": "Instagram",
-                        "category": "能源環保"
-                    },
-                    "social_reactions": [
-                        "假的啦，再生能源明明比石化好 (質疑)"
-                    ],
-                    "ai_impact": {
-                        "reach_count": 390,
-                        "trust_change": "-10 點"
-                    }
+    model_config = ConfigDict(defer_build=True, json_schema_extra={
+        "example": {
+            "session_id": "game_123",
+            "current_round": {
+                "round_number": 3,
+                "ai_news": {
+                    "title": "據說新再生能源其實會導致更多空汙",
+                    "platform": "Instagram",
+                    "category": "能源環保"
                 },
-                "platform_status": [
-                    {
-                        "platform_name": "Instagram",
-                        "player_trust": 56,
-                        "ai_trust": 40,
-                        "spread_rate": 75,
-                        "trust_trend": "↗"
-                    }
+                "social_reactions": [
+                    "假的啦，再生能源明明比石化好 (質疑)"
                 ],
-                "game_progress": {
-                    "current_round": 3,
-                    "max_rounds": 10,
-                    "is_ended": False
-                },
-                "game_end_info": None
-            }
+                "ai_impact": {
+                    "reach_count": 390,
+                    "trust_change": "-10 點"
+                }
+            },
+            "platform_status": [
+                {
+                    "platform_name": "Instagram",
+                    "player_trust": 56,
+                    "ai_trust": 40,
+                    "spread_rate": 75,
+                    "trust_trend": "↗"
+                }
+            ],
+            "game_progress": {
+                "current_round": 3,
+                "max_rounds": 10,
+                "is_ended": False
+            },
+            "game_end_info": None
         }
+    })
 
 class ArticleMeta(BaseModel):
     """
@@ -167,21 +166,20 @@ class ArticleMeta(BaseModel):
     requirement: Optional[str] = Field(None, description="語氣或風格需求（如有）")
     veracity: Optional[str] = Field(None, description="AI 生成文章的真實性，由 AI 或 GM 判定")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "title": "極端氣候威脅全球能源",
-                "content": "全球近年發生多起極端氣候事件，專家警告能源政策必須加快轉型...",
-                "polished_content": None,
-                "image_url": "https://img.server/image1.jpg",
-                "source": "聯合報",
-                "author": "ai",
-                "published_date": "2025-05-21T14:45:00",
-                "target_platform": "Instagram",
-                "requirement": "強調危機感、簡明易懂",
-                "veracity": "partial"
-            }
+    model_config = ConfigDict(frozen=True, json_schema_extra={
+        "example": {
+            "title": "極端氣候威脅全球能源",
+            "content": "全球近年發生多起極端氣候事件，專家警告能源政策必須加快轉型...",
+            "polished_content": None,
+            "image_url": "https://img.server/image1.jpg",
+            "source": "聯合報",
+            "author": "ai",
+            "published_date": "2025-05-21T14:45:00",
+            "target_platform": "Instagram",
+            "requirement": "強調危機感、簡明易懂",
+            "veracity": "partial"
         }
+    })
 
 class ToolUsed(BaseModel):
     """
@@ -189,12 +187,44 @@ class ToolUsed(BaseModel):
     """
     tool_name: str = Field(..., description="工具名稱")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "tool_name": "事實查核"
-            }
+    model_config = ConfigDict(frozen=True, json_schema_extra={
+        "example": {
+            "tool_name": "事實查核"
         }
+    })
+
+class PlatformSetup(BaseModel):
+    """
+    平台與受眾組合（遊戲初始化時決定）
+    """
+    name: str = Field(..., description="平台名稱")
+    audience: str = Field(..., description="平台受眾")
+
+    model_config = ConfigDict(frozen=True, json_schema_extra={
+        "example": {"name": "Facebook", "audience": "年輕族群"}
+    })
+
+class ToolInfo(BaseModel):
+    """
+    可用工具資訊（由 ToolAvailabilityLogic 產生；玩家回合可由前端帶回）
+    """
+    tool_name: str = Field(..., description="工具名稱")
+    description: Optional[str] = Field(None, description="工具說明")
+    trust_effect: Optional[float] = Field(None, description="信任值效果倍率")
+    spread_effect: Optional[float] = Field(None, description="傳播率效果倍率")
+    applicable_to: Optional[str] = Field(None, description="適用對象（player/ai/both）")
+    available_from_round: Optional[int] = Field(None, description="從第幾回合開始可用")
+
+    model_config = ConfigDict(frozen=True, json_schema_extra={
+        "example": {
+            "tool_name": "圖片查證",
+            "description": "協助判斷圖片真偽",
+            "trust_effect": 1.2,
+            "spread_effect": 1.0,
+            "applicable_to": "player",
+            "available_from_round": 1
+        }
+    })
 
 # ========== Agent Specific Responses ==========
 
@@ -206,16 +236,15 @@ class FakeNewsAgentResponse(BaseModel):
     veracity: str = Field(..., description="Agent判定的新聞真實性 (false, partial, true)")
     tool_used: Optional[List[ToolUsed]] = Field(None, description="Agent實際使用的工具")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "title": "驚爆！太陽能板夜間竟能發電？最新突破能源界將改寫歷史！",
-                "content": "科學家團隊深夜宣布，透過革命性的奈米塗層技術，成功讓太陽能板在無光環境下收集月光甚至星光轉換為可用電力...",
-                "image_url": "https://example.com/fake_solar_night.jpg",
-                "source": "全球科技前沿報",
-                "veracity": "false"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "title": "驚爆！太陽能板夜間竟能發電？最新突破能源界將改寫歷史！",
+            "content": "科學家團隊深夜宣布，透過革命性的奈米塗層技術，成功讓太陽能板在無光環境下收集月光甚至星光轉換為可用電力...",
+            "image_url": "https://example.com/fake_solar_night.jpg",
+            "source": "全球科技前沿報",
+            "veracity": "false"
         }
+    })
 
 class GameMasterAgentPlatformStatus(BaseModel):
     platform_name: str = Field(..., description="平台名稱")
@@ -223,15 +252,14 @@ class GameMasterAgentPlatformStatus(BaseModel):
     ai_trust: int = Field(..., description="該平台AI信任度")
     spread_rate: int = Field(..., description="該平台傳播率")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "platform_name": "Facebook",
-                "player_trust": 52,
-                "ai_trust": 45,
-                "spread_rate": 70
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "platform_name": "Facebook",
+            "player_trust": 52,
+            "ai_trust": 45,
+            "spread_rate": 70
         }
+    })
 
 class GameMasterAgentResponse(BaseModel):
     trust_change: int = Field(..., description="本回合目標平台信任值變化")
@@ -241,22 +269,26 @@ class GameMasterAgentResponse(BaseModel):
     effectiveness: str = Field(..., description="行動有效性 (low, medium, high)")
     simulated_comments: List[str] = Field(..., description="模擬的社群評論")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "trust_change": -10,
-                "spread_change": 15,
-                "reach_count": 390,
-                "platform_status": [
-                    {"platform_name": "Facebook", "player_trust": 40, "ai_trust": 60, "spread_rate": 75},
-                    {"platform_name": "Instagram", "player_trust": 50, "ai_trust": 50, "spread_rate": 50}
-                ],
-                "effectiveness": "high",
-                "simulated_comments": [
-                    "這太誇張了吧！", "消息來源可靠嗎？", "已轉發，大家注意！"
-                ]
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "trust_change": -10,
+            "spread_change": 15,
+            "reach_count": 390,
+            "platform_status": [
+                {"platform_name": "Facebook", "player_trust": 40, "ai_trust": 60, "spread_rate": 75},
+                {"platform_name": "Instagram", "player_trust": 50, "ai_trust": 50, "spread_rate": 50}
+            ],
+            "effectiveness": "high",
+            "simulated_comments": [
+                "這太誇張了吧！", "消息來源可靠嗎？", "已轉發，大家注意！"
+            ]
         }
+    })
+
+class NewsPolishAgentResponse(BaseModel):
+    polished_content: str = Field(..., description="Agent潤稿後的新聞內容")
+    suggestions: Optional[List[str]] = Field(None, description="Agent提出的其他改進建議")
+    reasoning: Optional[str] = Field(None, description="Agent的潤稿思路說明")
 
 # ========== 共用回應 DTO（基底） ==========
 
@@ -271,64 +303,63 @@ class BaseRoundResponse(BaseModel):
     trust_change: int = Field(..., description="本回合造成的信任值變化")
     reach_count: int = Field(..., description="本回合的觸及人數")
     spread_change: int = Field(..., description="本回合造成的傳播率變化")
-    platform_setup: List[Dict[str, Any]] = Field(..., description="平台與受眾組合（初始化時）")
+    platform_setup: List[PlatformSetup] = Field(..., description="平台與受眾組合（初始化時）")
     platform_status: List[PlatformStatus] = Field(..., description="三平台目前狀態")
     tool_used: Optional[List[ToolUsed]] = Field(None, description="實際使用的工具")
-    tool_list: Optional[List[Dict[str, Any]]] = Field(None, description="全部可用工具")
+    tool_list: Optional[List[ToolInfo]] = Field(None, description="全部可用工具")
     effectiveness: Optional[str] = Field(None, description="本回合貼文有效度（low/medium/high）")
     simulated_comments: Optional[List[str]] = Field(None, description="模擬群眾留言")
     game_end_info: Optional[Dict[str, Any]] = Field(None, description="遊戲結束資訊（如果遊戲結束）")
     # 新增：即時遊戲狀態
     dashboard_info: Optional[Dict[str, Any]] = Field(None, description="當前遊戲狀態面板資訊")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "session_id": "game_002",
-                "round_number": 2,
-                "actor": "player",
-                "article": {
-                    "title": "大雨致水災 民生受影響",
-                    "content": "昨夜連續暴雨導致多區域淹水，專家呼籲儘速檢討排水政策...",
-                    "author": "player1",
-                    "published_date": "2025-05-22T08:00:00"
-                },
-                "trust_change": 8,
-                "reach_count": 12345,
-                "spread_change": 5,
-                "platform_setup": [
-                    {"name": "Facebook", "audience": "年輕族群"},
-                    {"name": "Instagram", "audience": "中年族群"},
-                    {"name": "Thread", "audience": "老年族群"}
-                ],
-                "platform_status": [
-                    {
-                        "platform_name": "Facebook",
-                        "player_trust": 68,
-                        "ai_trust": 51,
-                        "spread_rate": 42
-                    }
-                ],
-                "tool_used": [
-                    {
-                        "tool_name": "圖片查證"
-                    }
-                ],
-                "tool_list": [
-                    {
-                        "tool_name": "圖片查證",
-                        "description": "協助判斷圖片真偽",
-                        "applicable_to": "both"
-                    }
-                ],
-                "effectiveness": "medium",
-                "simulated_comments": [
-                    "這新聞看起來很可疑！",
-                    "真的發生這麼嚴重嗎？",
-                    "請政府說明！"
-                ]
-            }
+    model_config = ConfigDict(frozen=True, json_schema_extra={
+        "example": {
+            "session_id": "game_002",
+            "round_number": 2,
+            "actor": "player",
+            "article": {
+                "title": "大雨致水災 民生受影響",
+                "content": "昨夜連續暴雨導致多區域淹水，專家呼籲儘速檢討排水政策...",
+                "author": "player1",
+                "published_date": "2025-05-22T08:00:00"
+            },
+            "trust_change": 8,
+            "reach_count": 12345,
+            "spread_change": 5,
+            "platform_setup": [
+                {"name": "Facebook", "audience": "年輕族群"},
+                {"name": "Instagram", "audience": "中年族群"},
+                {"name": "Thread", "audience": "老年族群"}
+            ],
+            "platform_status": [
+                {
+                    "platform_name": "Facebook",
+                    "player_trust": 68,
+                    "ai_trust": 51,
+                    "spread_rate": 42
+                }
+            ],
+            "tool_used": [
+                {
+                    "tool_name": "圖片查證"
+                }
+            ],
+            "tool_list": [
+                {
+                    "tool_name": "圖片查證",
+                    "description": "協助判斷圖片真偽",
+                    "applicable_to": "both"
+                }
+            ],
+            "effectiveness": "medium",
+            "simulated_comments": [
+                "這新聞看起來很可疑！",
+                "真的發生這麼嚴重嗎？",
+                "請政府說明！"
+            ]
         }
+    })
 
 # ========== 遊戲開始 ==========
 
@@ -369,7 +400,7 @@ class PlayerTurnRequest(BaseModel):
     round_number: int = Field(..., description="回合數")
     article: ArticleMeta = Field(..., description="玩家發布的新聞")
     tool_used: Optional[List[ToolUsed]] = Field(None, description="玩家實際使用的工具")
-    tool_list: Optional[List[Dict[str, Any]]] = Field(None, description="全部可用工具（前端可留空）")
+    tool_list: Optional[List[ToolInfo]] = Field(None, description="全部可用工具（前端可留空）")
 
 class PlayerTurnResponse(BaseRoundResponse):
     """
@@ -414,27 +445,18 @@ class NewsPolishResponse(BaseModel):
     suggestions: Optional[List[str]] = Field(None, description="其他改進建議")
     reasoning: Optional[str] = Field(None, description="潤稿思路說明")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "original_content": "台南今天舉辦淨灘活動，共有200人參與，清出300公斤垃圾。",
-                "polished_content": "【台南環保行動】藍天碧海守護者集結！今日台南黃金海岸淨灘活動吸引超過200名志工熱情參與，他們在短短三小時內清理出驚人的300公斤海洋垃圾，展現公民守護海洋生態的決心...",
-                "suggestions": [
-                    "可新增參與者感想或組織者聲明",
-                    "建議加入未來淨灘活動資訊"
-                ],
-                "reasoning": "修改重點包括：加入吸引人的標題、使用更生動的描述語言、強調環保意識、突出成就感與使命感。"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "original_content": "台南今天舉辦淨灘活動，共有200人參與，清出300公斤垃圾。",
+            "polished_content": "【台南環保行動】藍天碧海守護者集結！今日台南黃金海岸淨灘活動吸引超過200名志工熱情參與，他們在短短三小時內清理出驚人的300公斤海洋垃圾，展現公民守護海洋生態的決心...",
+            "suggestions": [
+                "可新增參與者感想或組織者聲明",
+                "建議加入未來淨灘活動資訊"
+            ],
+            "reasoning": "修改重點包括：加入吸引人的標題、使用更生動的描述語言、強調環保意識、突出成就感與使命感。"
         }
+    })
 
 
-class SimulateCommentsRequest(BaseModel):
-    session_id: str = Field(..., description="遊戲 Session ID")
-    article: "ArticleMeta" = Field(..., description="要產生留言的新聞資料")
-    actor: str = Field(..., description="新聞發布者（ai/player）")
-    round_number: int = Field(..., description="回合數")
-    platform: str = Field(..., description="平台名稱")
-    audience: Optional[str] = Field(None, description="平台受眾")
-    
 class SimulateCommentsResponse(BaseModel):
     comments: List[str] = Field(default_factory=list, description="產生的留言清單")
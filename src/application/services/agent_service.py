@@ -2,9 +2,13 @@
 Agent 相關的服務層邏輯。
 處理 Agent 的建立、更新、查詢等操作。
 """
-from typing import List, Optional, Dict, Any
+import threading
+import time
 from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 
+import orjson
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from src.application.dto.agent_dto import (
@@ -16,6 +20,117 @@ from src.application.dto.agent_dto import (
 from src.infrastructure.database.agent_repo import AgentRepository
 from src.utils.exceptions import ResourceNotFoundError
 from src.infrastructure.database.models.agent import Agent
+from src.config import settings
+
+
+# 開發環境保留完整驗證以便及早發現資料問題；其他環境信任 ORM 資料，略過逐欄驗證
+_VALIDATE_AGENT_RESPONSES = settings.is_development
+
+
+def _format_timestamps(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    投影查詢的時間欄位在 PostgreSQL 已由資料庫格式化為字串；
+    其他資料庫仍為 datetime 時才於 Python 端格式化。
+    """
+    for key in ("created_at", "updated_at"):
+        value = fields[key]
+        if isinstance(value, datetime):
+            fields[key] = value.isoformat()
+    return fields
+
+
+def _agent_response_from_fields(fields: Dict[str, Any]) -> AgentResponse:
+    """
+    以資料庫欄位建立響應 DTO。
+    
+    資料來自資料庫，型別已由欄位定義保證，非開發環境以 `model_construct` 直接建構。
+    """
+    if _VALIDATE_AGENT_RESPONSES:
+        return AgentResponse(**fields)
+    return AgentResponse.model_construct(**fields)
+
+
+def _to_agent_response(agent: Agent) -> AgentResponse:
+    """將 ORM Agent 轉換為響應 DTO。"""
+    return _agent_response_from_fields(dict(
+        id=agent.id,
+        agent_name=agent.agent_name,
+        provider=agent.provider,
+        model_name=agent.model_name,
+        description=agent.description,
+        tools=agent.tools,
+        temperature=agent.temperature,
+        created_at=agent.created_at.isoformat(),
+        updated_at=agent.updated_at.isoformat()
+    ))
+
+
+# 依名稱查詢的快取存活時間（秒）與容量上限
+_AGENT_BY_NAME_CACHE_TTL = 60
+_AGENT_BY_NAME_CACHE_MAXSIZE = 256
+
+# 依名稱查詢快取 {agent_name: (response, timestamp)}，僅快取找到的 Agent
+_agent_by_name_cache: Dict[str, Tuple[AgentResponse, float]] = {}
+_agent_by_name_lock = threading.Lock()
+
+
+def _get_agent_response_by_name(agent_name: str) -> Optional[AgentResponse]:
+    """
+    依名稱查詢 Agent 並快取轉換後的響應 DTO。
+    
+    Agent 屬於少量、以讀取為主的設定資料。本程序內的寫入操作會透過
+    `_clear_agent_caches_after_commit()` 於提交後讓快取失效；多個 worker 程序時，其他程序的寫入
+    最遲在 TTL 到期後生效。
+    """
+    current_time = time.time()
+    cached = _agent_by_name_cache.get(agent_name)
+    if cached is not None and current_time - cached[1] < _AGENT_BY_NAME_CACHE_TTL:
+        return cached[0]
+    
+    fields = AgentRepository().get_summary_by_name(agent_name)
+    if not fields:
+        # 查無結果不快取，避免與建立同名 Agent 的請求競爭時，把「不存在」保留到 TTL 到期
+        return None
+    response = _agent_response_from_fields(_format_timestamps(fields))
+    
+    # 路由在執行緒池中執行；超過容量時淘汰最早寫入的項目
+    with _agent_by_name_lock:
+        _agent_by_name_cache.pop(agent_name, None)
+        if len(_agent_by_name_cache) >= _AGENT_BY_NAME_CACHE_MAXSIZE:
+            _agent_by_name_cache.pop(next(iter(_agent_by_name_cache)))
+        _agent_by_name_cache[agent_name] = (response, current_time)
+    
+    return response
+
+
+# Agent 列表快取存活時間（秒）
+_AGENT_LIST_CACHE_TTL = 30
+
+# Agent 列表快取 (序列化後的 JSON, timestamp)
+_agent_list_cache: Optional[Tuple[bytes, float]] = None
+
+
+def _clear_agent_caches(*_args: Any) -> None:
+    """清除所有 Agent 讀取快取。"""
+    global _agent_list_cache
+    _agent_list_cache = None
+    with _agent_by_name_lock:
+        _agent_by_name_cache.clear()
+
+
+def _clear_agent_caches_after_commit(db: Optional[Session]) -> None:
+    """
+    於寫入提交後清除 Agent 讀取快取，於建立、更新、刪除 Agent 後呼叫。
+    
+    使用請求範圍 session 時，提交由 DBSessionMiddleware 在送出回應前進行；
+    若在提交前就清除，同時進行的讀取會重新快取到提交前的資料。
+    未提供 session 時，repository 已自行提交，直接清除。
+    """
+    if db is None:
+        _clear_agent_caches()
+    else:
+        event.listen(db, "after_commit", _clear_agent_caches, once=True)
+
 
 class AgentService:
     """
@@ -62,18 +177,9 @@ class AgentService:
             debug=request.debug,
             db=self.db
         )
+        _clear_agent_caches_after_commit(self.db)
         
-        return AgentResponse(
-            id=agent.id,
-            agent_name=agent.agent_name,
-            provider=agent.provider,
-            model_name=agent.model_name,
-            description=agent.description,
-            tools=agent.tools,
-            temperature=agent.temperature,
-            created_at=agent.created_at.isoformat(),
-            updated_at=agent.updated_at.isoformat()
-        )
+        return _to_agent_response(agent)
     
     def get_agent(self, agent_id: int) -> AgentResponse:
         """
@@ -88,19 +194,10 @@ class AgentService:
         Raises:
             ResourceNotFoundError: 如果找不到 Agent
         """
-        agent = self.repo.get_by_id(agent_id, db=self.db)
+        # 投影查詢直接取得響應欄位，不建立 ORM 實體
+        fields = self.repo.get_summary_by_id(agent_id, db=self.db)
         
-        return AgentResponse(
-            id=agent.id,
-            agent_name=agent.agent_name,
-            provider=agent.provider,
-            model_name=agent.model_name,
-            description=agent.description,
-            tools=agent.tools,
-            temperature=agent.temperature,
-            created_at=agent.created_at.isoformat(),
-            updated_at=agent.updated_at.isoformat()
-        )
+        return _agent_response_from_fields(_format_timestamps(fields))
     
     def get_agent_by_name(self, agent_name: str) -> Optional[AgentResponse]:
         """
@@ -112,22 +209,7 @@ class AgentService:
         Returns:
             Agent 響應 DTO，如果未找到則返回 None
         """
-        agent = self.repo.get_by_name(agent_name, db=self.db)
-        
-        if not agent:
-            return None
-            
-        return AgentResponse(
-            id=agent.id,
-            agent_name=agent.agent_name,
-            provider=agent.provider,
-            model_name=agent.model_name,
-            description=agent.description,
-            tools=agent.tools,
-            temperature=agent.temperature,
-            created_at=agent.created_at.isoformat(),
-            updated_at=agent.updated_at.isoformat()
-        )
+        return _get_agent_response_by_name(agent_name)
     
     def list_agents(self) -> AgentListResponse:
         """
@@ -136,32 +218,31 @@ class AgentService:
         Returns:
             Agent 列表響應 DTO
         """
-        agents: List[Agent] = self.repo.get_all(db=self.db)
+        return AgentListResponse.model_validate_json(self.list_agents_json())
+    
+    def list_agents_json(self) -> bytes:
+        """
+        獲取已序列化的 Agent 列表 JSON，供路由直接回傳而不再經過 response_model 處理。
         
-        agent_responses: List[AgentResponse] = []
-        for agent in agents:
-            # 明確的類型標註
-            created_at: datetime = agent.created_at
-            updated_at: datetime = agent.updated_at
-            
-            agent_responses.append(
-                AgentResponse(
-                    id=agent.id,
-                    agent_name=agent.agent_name,
-                    provider=agent.provider,
-                    model_name=agent.model_name,
-                    description=agent.description,
-                    tools=agent.tools,
-                    temperature=agent.temperature,
-                    created_at=created_at.isoformat(),
-                    updated_at=updated_at.isoformat()
-                )
-            )
-            
-        return AgentListResponse(
-            agents=agent_responses,
-            total=len(agent_responses)
-        )
+        資料來自資料庫投影查詢，直接由 orjson 序列化，不建立 ORM 實體與 DTO。
+        
+        Returns:
+            Agent 列表響應的 JSON bytes
+        """
+        global _agent_list_cache
+        
+        # 短時間內的重複查詢（如前端輪詢）直接使用快取
+        if _agent_list_cache is not None:
+            cached_json, cache_time = _agent_list_cache
+            if time.time() - cache_time < _AGENT_LIST_CACHE_TTL:
+                return cached_json
+        
+        agents: List[Dict[str, Any]] = self.repo.list_summaries(db=self.db)
+        
+        response_json = orjson.dumps({"agents": agents, "total": len(agents)})
+        _agent_list_cache = (response_json, time.time())
+        
+        return response_json
     
     def update_agent(self, agent_id: int, request: AgentUpdateRequest) -> AgentResponse:
         """
@@ -177,11 +258,8 @@ class AgentService:
         Raises:
             ResourceNotFoundError: 如果找不到 Agent
         """
-        # 構建更新數據
-        update_data: Dict[str, Any] = {}
-        for key, value in request.dict(exclude_unset=True).items():
-            if value is not None:
-                update_data[key] = value
+        # 構建更新數據：只保留有設定且非 None 的欄位
+        update_data: Dict[str, Any] = request.model_dump(exclude_unset=True, exclude_none=True)
                 
         if not update_data:
             # 如果沒有需要更新的資料，直接返回現有 Agent
@@ -189,23 +267,11 @@ class AgentService:
                 
         # 更新 Agent
         agent: Agent = self.repo.update(agent_id, update_data, db=self.db)
-        
-        # 明確的類型標註
-        created_at: datetime = agent.created_at
-        updated_at: datetime = agent.updated_at
+        _clear_agent_caches_after_commit(self.db)
         
         # 轉換為響應 DTO
-        return AgentResponse(
-            id=agent.id,
-            agent_name=agent.agent_name,
-            provider=agent.provider,
-            model_name=agent.model_name,
-            description=agent.description,
-            tools=agent.tools,
-            temperature=agent.temperature,
-            created_at=created_at.isoformat(),
-            updated_at=updated_at.isoformat()
-        )
+        return _to_agent_response(agent)
     
     def delete_agent(self, agent_id: int) -> None:
         self.repo.delete(agent_id, db=self.db)
+        _clear_agent_caches_after_commit(self.db)
@@ -1,14 +1,19 @@
-import json
-from typing import List, Optional, Dict, Any
+import hashlib
+import threading
+import time
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
+
+import orjson
 from src.application.dto.game_dto import (
-    NewsPolishRequest, NewsPolishResponse,
+    NewsPolishRequest, NewsPolishResponse, NewsPolishAgentResponse,
     GameStartRequest, GameStartResponse,
     AiTurnRequest, AiTurnResponse,
     PlayerTurnRequest, PlayerTurnResponse,
     StartNextRoundRequest, StartNextRoundResponse,
     GameDashboardRequest, GameDashboardResponse, CurrentRoundInfo, PlatformDashboardStatus,
-    ArticleMeta
+    ArticleMeta, ToolInfo
 )
 from src.infrastructure.database.game_setup_repo import GameSetupRepository
 from src.infrastructure.database.platform_state_repo import PlatformStateRepository
@@ -16,7 +21,9 @@ from src.infrastructure.database.news_repo import NewsRepository
 from src.infrastructure.database.action_record_repo import ActionRecordRepository
 from src.infrastructure.database.game_round_repo import GameRoundRepository
 from src.infrastructure.database.article_polish_record_repo import ArticlePolishRecordRepository
+from src.infrastructure.database.utils import manage_session
 from src.domain.logic.agent_factory import AgentFactory
+from src.domain.models.game import Game
 from src.domain.logic.game_initialization import GameInitializationLogic
 from src.domain.logic.ai_turn import AiTurnLogic
 from src.domain.logic.game_master import GameMasterLogic
@@ -39,6 +46,40 @@ from src.domain.logic.tool_availability_logic import ToolAvailabilityLogic
 from src.domain.logic.game_end_logic import GameEndLogic
 from src.config.game_config import game_config
 from src.domain.logic.simulate_comments import SimulateCommentsLogic
+
+# 效果評級翻譯表（唯讀，模組載入時建立一次）
+_EFFECTIVENESS_TRANSLATIONS = MappingProxyType({
+    "low": "低效",
+    "medium": "中度有效",
+    "high": "高效"
+})
+
+# 潤稿請求中有值才傳給 Agent 模板的選填欄位（欄位名稱即模板變數名稱）
+_POLISH_OPTIONAL_FIELDS = ("platform", "platform_user", "current_situation")
+
+# 潤稿結果快取：相同的潤稿變數（內容、要求、來源、平台等）直接重用上次的 LLM 結果
+_POLISH_CACHE_TTL = 3600
+_POLISH_CACHE_MAXSIZE = 256
+
+# {變數雜湊: (response, timestamp)}
+_polish_cache: Dict[str, Tuple[NewsPolishResponse, float]] = {}
+_polish_cache_lock = threading.Lock()
+
+
+def _polish_cache_key(variables: Dict[str, Any]) -> str:
+    """以排序後的變數 JSON 計算潤稿快取鍵。"""
+    payload = orjson.dumps(variables, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _store_polish_result(cache_key: str, response: NewsPolishResponse) -> None:
+    """寫入潤稿快取，超過上限時淘汰最舊的項目。"""
+    with _polish_cache_lock:
+        _polish_cache.pop(cache_key, None)
+        if len(_polish_cache) >= _POLISH_CACHE_MAXSIZE:
+            _polish_cache.pop(next(iter(_polish_cache)))
+        _polish_cache[cache_key] = (response, time.time())
+
         
 class GameService:
     def __init__(
@@ -91,32 +132,47 @@ class GameService:
         # Save to database
         platforms_data = self.game_state_logic.convert_platforms_to_db_format(game.platforms)
         
-        self.setup_repo.create_game_setup(
-            session_id=game.session_id.value, 
-            platforms=platforms_data, 
-            player_initial_trust=game_config.initial_player_trust, 
-            ai_initial_trust=game_config.initial_ai_trust
-        )
+        # 遊戲初始資料共用同一個 session，只需一次 COMMIT；AI 回合的 LLM 呼叫不在此交易內
+        with manage_session() as db:
+            self.setup_repo.create_game_setup(
+                session_id=game.session_id.value, 
+                platforms=platforms_data, 
+                player_initial_trust=game_config.initial_player_trust, 
+                ai_initial_trust=game_config.initial_ai_trust,
+                db=db
+            )
 
-        self.state_repo.create_all_platforms_states(
+            self.state_repo.create_all_platforms_states(
+                session_id=game.session_id.value,
+                round_number=game.current_round,
+                platforms=platforms_data,
+                player_trust=game_config.initial_player_trust,
+                ai_trust=game_config.initial_ai_trust,
+                spread_rate=game_config.initial_spread_rate,
+                db=db
+            )
+            
+            self.round_repo.create_game_round(
+                session_id=game.session_id.value,
+                round_number=game.current_round,
+                is_completed=False,
+                db=db
+            )
+              
+        # Execute AI turn：剛建立的 game 即為寫入的初始狀態，直接沿用，免去重建時的兩次查詢
+        ai_response = self._execute_turn(
+            actor="ai",
             session_id=game.session_id.value,
             round_number=game.current_round,
-            platforms=platforms_data,
-            player_trust=game_config.initial_player_trust,
-            ai_trust=game_config.initial_ai_trust,
-            spread_rate=game_config.initial_spread_rate
+            article=None,
+            tool_used=[],
+            tool_list=None,
+            game=game
         )
-        
-        self.round_repo.create_game_round(
-            session_id=game.session_id.value,
-            round_number=game.current_round,
-            is_completed=False
+        # ai_response 已驗證過，直接沿用欄位建立，避免 model_dump 後再完整驗證一次
+        return GameStartResponse.model_construct(
+            _fields_set=ai_response.model_fields_set, **dict(ai_response)
         )
-              
-        # Execute AI turn
-        ai_request = AiTurnRequest(session_id=game.session_id.value, round_number=game.current_round)
-        ai_response = self.ai_turn(ai_request)
-        return GameStartResponse(**ai_response.model_dump())
 
     def ai_turn(self, request: AiTurnRequest) -> AiTurnResponse:
         return self._execute_turn(
@@ -174,22 +230,28 @@ class GameService:
                 f"原因：{self.game_end_logic.format_game_end_summary(game_end_result)['reason_message']}"
             )
 
-        platforms = self.setup_repo.get_by_session_id(session_id).platforms
-        self.state_repo.create_all_platforms_states(
-            session_id=session_id,
-            round_number=next_round_number,
-            platforms=platforms
-        )
-        
-        self.round_repo.create_game_round(
-            session_id=session_id,
-            round_number=next_round_number,
-            is_completed=False
-        )
+        platforms = self.setup_repo.get_platforms_by_session_id(session_id)
+        # 新回合的平台狀態與回合紀錄共用同一個 session，一次 COMMIT
+        with manage_session() as db:
+            self.state_repo.create_all_platforms_states(
+                session_id=session_id,
+                round_number=next_round_number,
+                platforms=platforms,
+                db=db
+            )
+            
+            self.round_repo.create_game_round(
+                session_id=session_id,
+                round_number=next_round_number,
+                is_completed=False,
+                db=db
+            )
         
         ai_request = AiTurnRequest(session_id=session_id, round_number=next_round_number)
         ai_response = self.ai_turn(ai_request)
-        return StartNextRoundResponse(**ai_response.model_dump())
+        return StartNextRoundResponse.model_construct(
+            _fields_set=ai_response.model_fields_set, **dict(ai_response)
+        )
 
     def _execute_turn(
         self,
@@ -198,7 +260,8 @@ class GameService:
         round_number: int,
         article: Optional[ArticleMeta],
         tool_used: Optional[List[PlayerToolUsedDTO]],
-        tool_list: Optional[List[Dict[str, Any]]]
+        tool_list: Optional[List[ToolInfo]],
+        game: Optional[Game] = None
     ):
         """重構後的回合執行 - 只負責流程編排"""
         logger.info(f"Executing turn for actor: {actor}", extra={
@@ -209,8 +272,9 @@ class GameService:
         if not self.agent_factory:
             raise BusinessLogicError("系統未設定 Agent Factory")
 
-        # 1. 重建遊戲狀態
-        game = self.game_state_manager.rebuild_game_state(session_id, round_number)
+        # 1. 重建遊戲狀態（呼叫端已持有最新狀態時略過）
+        if game is None:
+            game = self.game_state_manager.rebuild_game_state(session_id, round_number)
         
         # 2. 執行行動者回合
         turn_result = self.turn_execution_logic.execute_actor_turn(
@@ -227,16 +291,17 @@ class GameService:
             turn_result, game, self.tool_repo
         )
         
-        # 4. 持久化結果
-        action_id = self.game_state_manager.persist_turn_result(game_turn_result)
-        
-        # 5. 標記玩家回合完成
-        if actor == "player":
-            self.round_repo.update_game_round(
-                session_id=session_id,
-                round_number=round_number,
-                is_completed=True
-            )
+        # 4. 持久化結果，並於同一交易中 5. 標記玩家回合完成
+        with manage_session() as db:
+            action_id = self.game_state_manager.persist_turn_result(game_turn_result, db=db)
+            
+            if actor == "player":
+                self.round_repo.update_game_round(
+                    session_id=session_id,
+                    round_number=round_number,
+                    is_completed=True,
+                    db=db
+                )
         
         # 6. 檢查遊戲結束條件
         platform_states_for_check = [
@@ -437,29 +502,19 @@ class GameService:
     ) -> List[PlatformDashboardStatus]:
         """建立平台面板狀態（包含趨勢）"""
         dashboard_statuses = []
+        prev_player_trust = self._get_previous_player_trust(session_id, current_round)
         
         for state in current_states:
             # 計算趨勢（與上一回合比較）
             trust_trend = "→"  # 默認沒有變化
             
-            if current_round > 1:
-                try:
-                    prev_states = self.state_repo.get_by_session_and_round(
-                        session_id, current_round - 1
-                    )
-                    prev_state = next(
-                        (s for s in prev_states if s.platform_name == state.platform_name), 
-                        None
-                    )
-                    
-                    if prev_state:
-                        player_diff = state.player_trust - prev_state.player_trust
-                        if player_diff > 0:
-                            trust_trend = "↗"  # 上升
-                        elif player_diff < 0:
-                            trust_trend = "↘"  # 下降
-                except:
-                    pass  # 如果無法取得上一回合數據，保持默認值
+            prev_trust = prev_player_trust.get(state.platform_name)
+            if prev_trust is not None:
+                player_diff = state.player_trust - prev_trust
+                if player_diff > 0:
+                    trust_trend = "↗"  # 上升
+                elif player_diff < 0:
+                    trust_trend = "↘"  # 下降
             
             dashboard_status = PlatformDashboardStatus(
                 platform_name=state.platform_name,
@@ -473,18 +528,29 @@ class GameService:
         
         return dashboard_statuses
     
+    def _get_previous_player_trust(self, session_id: str, current_round: int) -> Dict[str, int]:
+        """
+        一次查詢上一回合各平台的玩家信任值，供所有平台的趨勢計算共用。
+        
+        Returns:
+            {platform_name: player_trust}，第一回合或無法取得資料時為空字典
+        """
+        if current_round <= 1:
+            return {}
+        
+        try:
+            prev_states = self.state_repo.get_by_session_and_round(session_id, current_round - 1)
+        except Exception:
+            return {}  # 如果無法取得上一回合數據，趨勢保持默認值
+        
+        return {s.platform_name: s.player_trust for s in prev_states}
+    
     def _translate_effectiveness(self, effectiveness: str) -> str:
         """翻譯效果評級"""
         if not effectiveness:
             return "未評估"
         
-        translation = {
-            "low": "低效",
-            "medium": "中度有效",
-            "high": "高效"
-        }
-        
-        return translation.get(effectiveness.lower(), effectiveness)
+        return _EFFECTIVENESS_TRANSLATIONS.get(effectiveness.lower(), effectiveness)
     
     def _build_dashboard_info_for_turn(
         self, 
@@ -586,29 +652,19 @@ class GameService:
     ) -> List[Dict[str, Any]]:
         """從平台狀態建立面板狀態（簡化版）"""
         dashboard_statuses = []
+        prev_player_trust = self._get_previous_player_trust(session_id, current_round)
         
         for state in platform_states:
             # 計算趋勢
             trust_trend = "→"  # 默認
             
-            if current_round > 1:
-                try:
-                    prev_states = self.state_repo.get_by_session_and_round(
-                        session_id, current_round - 1
-                    )
-                    prev_state = next(
-                        (s for s in prev_states if s.platform_name == state["platform_name"]), 
-                        None
-                    )
-                    
-                    if prev_state:
-                        player_diff = state["player_trust"] - prev_state.player_trust
-                        if player_diff > 0:
-                            trust_trend = "↗"
-                        elif player_diff < 0:
-                            trust_trend = "↘"
-                except:
-                    pass
+            prev_trust = prev_player_trust.get(state["platform_name"])
+            if prev_trust is not None:
+                player_diff = state["player_trust"] - prev_trust
+                if player_diff > 0:
+                    trust_trend = "↗"
+                elif player_diff < 0:
+                    trust_trend = "↘"
             
             dashboard_status = {
                 "platform_name": state["platform_name"],
@@ -622,7 +678,7 @@ class GameService:
         
         return dashboard_statuses
     
-    def polish_news(self, request: NewsPolishRequest) -> NewsPolishResponse:
+    async def polish_news(self, request: NewsPolishRequest) -> NewsPolishResponse:
         if not self.agent_factory:
             raise BusinessLogicError("系統未設定 Agent Factory")
         
@@ -630,49 +686,58 @@ class GameService:
         
         if request.sources:
             variables["sources"] = "\n".join(request.sources)
-        if request.platform:
-            variables["platform"] = request.platform
-        if request.platform_user:
-            variables["platform_user"] = request.platform_user
-        if request.current_situation:
-            variables["current_situation"] = request.current_situation
+        variables.update(
+            (field, value) for field in _POLISH_OPTIONAL_FIELDS
+            if (value := getattr(request, field))
+        )
         if request.additional_context:
             variables.update(request.additional_context)
         
+        cache_key = _polish_cache_key(variables)
+        cached = _polish_cache.get(cache_key)
+        if cached is not None and time.time() - cached[1] < _POLISH_CACHE_TTL:
+            return cached[0]
+        
         try:
-            result = self.agent_factory.run_agent_by_name(
+            # 以結構化輸出取得潤稿結果，Agent 直接回傳 NewsPolishAgentResponse
+            result = await self.agent_factory.arun_agent_by_name(
                 session_id=request.session_id,
                 agent_name="news_polish_agent", 
                 variables=variables,
-                input_text="input_text"
+                input_text="input_text",
+                response_model=NewsPolishAgentResponse
             )
             
-            if isinstance(result, dict):
-                return NewsPolishResponse(
+            if isinstance(result, NewsPolishAgentResponse):
+                response = NewsPolishResponse(
                     original_content=request.content,
-                    polished_content=result.get("polished_content", ""),
-                    suggestions=result.get("suggestions"),
-                    reasoning=result.get("reasoning")
+                    **result.model_dump()
                 )
-            elif isinstance(result, str):
+                # 只快取結構化結果，解析失敗的回退結果不應在一小時內重複回傳
+                _store_polish_result(cache_key, response)
+                return response
+            
+            # 結構化輸出解析失敗時，模型可能回傳 dict 或 JSON 字串，自行取出欄位
+            result_data = result
+            if isinstance(result, str):
                 try:
-                    result_data = json.loads(result)
-                    return NewsPolishResponse(
-                        original_content=request.content,
-                        polished_content=result_data.get("polished_content", ""),
-                        suggestions=result_data.get("suggestions"),  
-                        reasoning=result_data.get("reasoning")
-                    )
-                except json.JSONDecodeError:
-                    return NewsPolishResponse(
-                        original_content=request.content,
-                        polished_content=result
-                    )
-            else:
+                    result_data = orjson.loads(result)
+                except orjson.JSONDecodeError:
+                    result_data = None
+            
+            if isinstance(result_data, dict):
                 return NewsPolishResponse(
                     original_content=request.content,
-                    polished_content=str(result)
+                    polished_content=result_data.get("polished_content", ""),
+                    suggestions=result_data.get("suggestions"),
+                    reasoning=result_data.get("reasoning")
                 )
+            
+            # 非 JSON 的文字整段視為潤稿內容
+            return NewsPolishResponse(
+                original_content=request.content,
+                polished_content=str(result)
+            )
                 
         except ResourceNotFoundError:
             raise ResourceNotFoundError(
@@ -5,7 +5,7 @@ Provides a unified Settings class that loads all environment variables.
 import os
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
 # 加載 .env 檔案
@@ -13,6 +13,12 @@ load_dotenv()
 
 # === 公共類別與函數 ===
 
+def _getenv_int(name: str) -> Optional[int]:
+    """讀取整數環境變數，未設定或為空字串時回傳 None"""
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
 @dataclass
 class Settings:
     """
@@ -46,6 +52,9 @@ class Settings:
     app_log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "debug"))
     app_log_to_file: bool = field(default_factory=lambda: os.getenv("LOG_TO_FILE", "false").lower() == "true")
     app_log_file_path: str = field(default_factory=lambda: os.getenv("LOG_FILE_PATH", "logs/app.log"))
+    app_threadpool_size: int = field(default_factory=lambda: int(os.getenv("THREADPOOL_SIZE", "100")))
+    # 正式環境的 worker 數，預設依 2n+1 規則（n 為 CPU 核心數）
+    app_workers: int = field(default_factory=lambda: int(os.getenv("WORKERS", str(2 * (os.cpu_count() or 1) + 1))))
     
     # API 密鑰
     openai_api_key: str = field(default_factory=lambda: os.getenv("OPENAI_API_KEY", ""))
@@ -56,6 +65,26 @@ class Settings:
     database_url_sync: str = field(default_factory=lambda: os.getenv("DATABASE_URL_SYNC", ""))
     database_url_async: str = field(default_factory=lambda: os.getenv("DATABASE_URL_ASYNC", ""))
     
+    # 資料庫連線池設定
+    # 每個 worker 行程各有一個連線池，所有 worker 合計最多
+    # workers × (db_pool_size + db_max_overflow) 條連線。
+    # DB_POOL_SIZE / DB_MAX_OVERFLOW 未設定時，依 db_max_connections 平均分配給各 worker
+    db_max_connections: int = field(default_factory=lambda: int(os.getenv("DB_MAX_CONNECTIONS", "90")))
+    db_pool_size: Optional[int] = field(default_factory=lambda: _getenv_int("DB_POOL_SIZE"))
+    db_max_overflow: Optional[int] = field(default_factory=lambda: _getenv_int("DB_MAX_OVERFLOW"))
+    db_pool_timeout: int = field(default_factory=lambda: int(os.getenv("DB_POOL_TIMEOUT", "30")))
+    db_pool_recycle: int = field(default_factory=lambda: int(os.getenv("DB_POOL_RECYCLE", "3600")))
+    
+    def __post_init__(self):
+        # 開發環境只有單一行程；正式環境依 worker 數分配連線上限，
+        # 常駐連線約佔 2/3，其餘作為尖峰額外連線，單一行程最多沿用 20 + 10
+        workers = self.app_workers if self.is_production else 1
+        per_worker = max(2, self.db_max_connections // max(1, workers))
+        if self.db_pool_size is None:
+            self.db_pool_size = min(20, max(1, per_worker * 2 // 3))
+        if self.db_max_overflow is None:
+            self.db_max_overflow = min(10, max(0, per_worker - self.db_pool_size))
+    
     @property
     def is_development(self) -> bool:
         """檢查是否為開發環境"""
@@ -87,6 +116,8 @@ class Settings:
                 "log_level": self.app_log_level,
                 "log_to_file": self.app_log_to_file,
                 "log_file_path": self.app_log_file_path,
+                "threadpool_size": self.app_threadpool_size,
+                "workers": self.app_workers,
                 "is_development": self.is_development,
                 "is_production": self.is_production,
             },
@@ -98,6 +129,11 @@ class Settings:
             "database": {
                 "url_sync": bool(self.database_url_sync),  # 只顯示是否設定，不顯示實際 URL
                 "url_async": bool(self.database_url_async),  # 只顯示是否設定，不顯示實際 URL
+                "max_connections": self.db_max_connections,
+                "pool_size": self.db_pool_size,
+                "max_overflow": self.db_max_overflow,
+                "pool_timeout": self.db_pool_timeout,
+                "pool_recycle": self.db_pool_recycle,
             }
         }
 
@@ -1,8 +1,14 @@
+import logging
 import pkgutil
 import importlib
-import json
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+import anyio
+import orjson
+from anthropic import Anthropic, AsyncAnthropic
+from openai import OpenAI, AsyncOpenAI
 
 from agno.agent import Agent as AgnoAgent
 from agno.models.openai import OpenAIChat
@@ -64,6 +70,29 @@ else:
 
 logger.info(f"系統中可用的工具類列表: {', '.join(TOOL_CLASSES.keys())}")
 
+# 各提供商共用的 SDK client（同步, 非同步）。每次呼叫都會新建模型實例，
+# 若讓模型各自建立 client，每次 LLM 請求都要重新建立 TCP/TLS 連線；
+# 共用 client 則可沿用其連線池中的 keep-alive 連線。
+_SDK_CLIENT_FACTORIES = {
+    "openai": (OpenAI, AsyncOpenAI),
+    "anthropic": (Anthropic, AsyncAnthropic),
+}
+_sdk_clients: Dict[str, Tuple[Any, Any]] = {}
+_sdk_clients_lock = threading.Lock()
+
+
+def _get_shared_clients(provider: str) -> Tuple[Any, Any]:
+    """取得（必要時建立）指定提供商共用的同步與非同步 SDK client"""
+    clients = _sdk_clients.get(provider)
+    if clients is None:
+        with _sdk_clients_lock:
+            clients = _sdk_clients.get(provider)
+            if clients is None:
+                sync_cls, async_cls = _SDK_CLIENT_FACTORIES[provider]
+                clients = (sync_cls(), async_cls())
+                _sdk_clients[provider] = clients
+    return clients
+
 class AgentFactory:
     """
     Agent Factory 服務，負責創建和管理 Agent
@@ -103,33 +132,13 @@ class AgentFactory:
             BusinessLogicError: 如果代理配置無效或執行失敗
         """
         try:
-            # 1. 獲取 Agent 資料
-            agent = self.agent_repo.get_by_name(agent_name)
-            if not agent:
-                raise ResourceNotFoundError(f"找不到名稱為 {agent_name} 的 Agent")
-
-            # 2. 處理變數替換
-            if variables:
-                if agent.description:
-                    agent.description = VariablesRenderer.render_variables(agent.description, variables)
-                if agent.instruction:
-                    agent.instruction = VariablesRenderer.render_variables(agent.instruction, variables)
-
-            # 3. 創建 Agent 實例
-            agent_instance = self._create_agent_from_data(session_id, agent, variables, response_model)
-            if not agent_instance:
-                raise BusinessLogicError("無法創建 Agent 實例")
+            agent_instance = self._prepare_agent_by_name(session_id, agent_name, variables, response_model)
 
             # 4. 執行 Agent
             result = agent_instance.run(input_text)
             
             # 5. 處理結果
-            if hasattr(result, 'content'):
-                content = result.content
-            else:
-                content = str(result)
-            
-            return content.strip() if isinstance(content, str) else content
+            return self._extract_content(result)
 
         except ResourceNotFoundError:
             raise
@@ -137,6 +146,75 @@ class AgentFactory:
             logger.error(f"執行代理 {agent_name} (session: {session_id}) 時發生錯誤: {str(e)}")
             raise BusinessLogicError(f"執行代理失敗: {str(e)}")
 
+    async def arun_agent_by_name(self,
+                                 session_id: str,
+                                 agent_name: str,
+                                 variables: Dict[str, Any],
+                                 input_text: Optional[str] = None,
+                                 response_model: Optional[type] = None,
+                                 **kwargs) -> Any:
+        """非同步執行指定名稱的代理，並返回結果內容。
+
+        Agent 設定的查詢與建立仍是同步的資料庫操作，交由執行緒池處理；
+        LLM 呼叫則透過 agno 的 arun 以 await 進行，等待期間不佔用執行緒。
+
+        Args:
+            session_id: 會話 ID
+            agent_name: 要運行的代理名稱
+            variables: 傳遞給代理模板的變數
+            input_text: 傳遞給 agent.arun 的輸入文本
+            response_model: 可選的響應模型類別
+            **kwargs: 額外參數
+
+        Returns:
+            代理執行結果內容
+
+        Raises:
+            ResourceNotFoundError: 如果找不到代理配置
+            BusinessLogicError: 如果代理配置無效或執行失敗
+        """
+        try:
+            agent_instance = await anyio.to_thread.run_sync(
+                self._prepare_agent_by_name, session_id, agent_name, variables, response_model
+            )
+
+            result = await agent_instance.arun(input_text)
+
+            return self._extract_content(result)
+
+        except ResourceNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"執行代理 {agent_name} (session: {session_id}) 時發生錯誤: {str(e)}")
+            raise BusinessLogicError(f"執行代理失敗: {str(e)}")
+
+    def _prepare_agent_by_name(self,
+                               session_id: str,
+                               agent_name: str,
+                               variables: Dict[str, Any],
+                               response_model: Optional[type] = None) -> AgnoAgent:
+        """取得 Agent 設定、替換變數並建立 Agent 實例。"""
+        # 1. 獲取 Agent 資料
+        agent = self.agent_repo.get_by_name(agent_name)
+        if not agent:
+            raise ResourceNotFoundError(f"找不到名稱為 {agent_name} 的 Agent")
+
+        # 2. 創建 Agent 實例（變數替換在 _create_agent_from_data 中進行一次，不修改 ORM 實體）
+        agent_instance = self._create_agent_from_data(session_id, agent, variables, response_model)
+        if not agent_instance:
+            raise BusinessLogicError("無法創建 Agent 實例")
+        return agent_instance
+
+    @staticmethod
+    def _extract_content(result: Any) -> Any:
+        """從 Agent 執行結果取出內容。"""
+        if hasattr(result, 'content'):
+            content = result.content
+        else:
+            content = str(result)
+        
+        return content.strip() if isinstance(content, str) else content
+
     def create_agent(self, agent_id: int, session_id: str = None, variables: Dict[str, Any] = None) -> Any:
         """
         根據 ID 創建 Agent。
@@ -208,7 +286,9 @@ class AgentFactory:
                 "debug": agent.debug
             }
 
-            logger.debug(f"Agent 配置: {config}")
+            # 配置含完整指令文字，僅在 DEBUG 啟用時才格式化
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(f"Agent 配置: {config}")
             
             # 2. 處理變數替換
             if variables:
@@ -267,9 +347,12 @@ class AgentFactory:
         provider_lower = provider.lower()
         try:
             if provider_lower == 'openai':
+                client, async_client = _get_shared_clients('openai')
                 return OpenAIChat(
                     id=model_name,
-                    temperature=temperature
+                    temperature=temperature,
+                    client=client,
+                    async_client=async_client
                 )
             elif provider_lower == 'google':
                 return Gemini(
@@ -277,13 +360,17 @@ class AgentFactory:
                     temperature=temperature
                 )
             elif provider_lower == 'anthropic':
+                client, async_client = _get_shared_clients('anthropic')
                 return Claude(
                     id=model_name,
-                    temperature=temperature
+                    temperature=temperature,
+                    client=client,
+                    async_client=async_client
                 )
             else:
                 logger.warning(f"不支援的提供商 '{provider}'，使用預設的 claude-3-7-sonnet-latest")
-                return Claude(id="claude-3-7-sonnet-latest")
+                client, async_client = _get_shared_clients('anthropic')
+                return Claude(id="claude-3-7-sonnet-latest", client=client, async_client=async_client)
         except Exception as e:
             logger.error(f"創建模型實例失敗: {str(e)}")
             raise BusinessLogicError(f"創建模型實例失敗: {str(e)}")
@@ -301,8 +388,8 @@ class AgentFactory:
         tools_cfg = agent_data.get("tools")
         if isinstance(tools_cfg, str):
             try:
-                tools_cfg = json.loads(tools_cfg)
-            except json.JSONDecodeError:
+                tools_cfg = orjson.loads(tools_cfg)
+            except orjson.JSONDecodeError:
                 logger.warning(f"工具設定不是合法 JSON：{tools_cfg}")
                 return []
 
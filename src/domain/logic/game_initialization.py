@@ -1,5 +1,5 @@
 import random
-import uuid
+import secrets
 from typing import List
 from src.domain.models.game import Game, Platform, SessionId, TrustScore, SpreadRate
 from src.config.game_config import game_config
@@ -10,7 +10,7 @@ class GameInitializationLogic:
         self.config = game_config
     
     def create_new_game(self) -> Game:
-        session_id = SessionId(f"game_{uuid.uuid4().hex}")
+        session_id = SessionId(f"game_{secrets.token_hex(16)}")
         platforms = self._create_initial_platforms()
         
         return Game(
@@ -20,8 +20,9 @@ class GameInitializationLogic:
         )
     
     def _create_initial_platforms(self) -> List[Platform]:
-        audiences = self.config.audience_types.copy()
-        random.shuffle(audiences)
+        # random.sample 直接回傳打亂後的新列表，不需先複製再原地洗牌
+        audience_types = self.config.audience_types
+        audiences = random.sample(audience_types, len(audience_types))
         
         return [
             Platform(
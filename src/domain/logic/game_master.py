@@ -1,7 +1,11 @@
+from operator import attrgetter
 from typing import Dict, Any, List
 from src.domain.models.game import Platform
 from src.application.dto.game_dto import ArticleMeta
 
+# 平台摘要的排序鍵
+_platform_name = attrgetter("name")
+
 class GameMasterLogic:
     def prepare_evaluation_variables(
         self, 
@@ -11,9 +15,10 @@ class GameMasterLogic:
         round_number: int,
         simulated_comments: List[str]
     ) -> Dict[str, Any]:
+        # 依平台名稱排序，使相同狀態產生相同的摘要，不受資料庫回傳順序影響
         platform_summary = "\n".join([
             f"{p.name}（受眾：{p.audience}） | 玩家信任: {p.player_trust.value} | AI信任: {p.ai_trust.value} | 傳播率: {p.spread_rate.value}%"
-            for p in all_platforms
+            for p in sorted(all_platforms, key=_platform_name)
         ])
         
         content = article.polished_content or article.content
@@ -2,8 +2,7 @@ from typing import List
 from src.domain.models.game import Game, Platform, SessionId, TrustScore, SpreadRate
 
 class GameStateLogic:
-    def rebuild_game_from_db(self, session_id: str, round_number: int, setup_data, platform_states) -> Game:
-        platforms_info = setup_data.platforms
+    def rebuild_game_from_db(self, session_id: str, round_number: int, platforms_info: List[dict], platform_states) -> Game:
         audience_map = {p["name"]: p["audience"] for p in platforms_info}
         
         platforms = [
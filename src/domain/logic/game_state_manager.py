@@ -1,15 +1,20 @@
 """
 遊戲狀態管理邏輯 - 負責遊戲狀態的重建、持久化等操作
 """
-from typing import Dict, Any, List
+import logging
+from typing import Dict, Any, List, Optional
+from sqlalchemy.orm import Session
 from src.application.dto.game_dto import GameMasterAgentResponse
 from src.domain.logic.turn_execution import TurnExecutionResult
 from src.domain.models.tool import AppliedToolEffectDetail, DomainTool
+from src.utils.exceptions import ResourceNotFoundError
 from src.utils.logger import logger
 
 
 class GameTurnResult:
     """完整的回合結果，包含 GM 評估和工具效果"""
+    __slots__ = ("turn_result", "gm_evaluation", "tool_effects")
+
     def __init__(
         self,
         turn_result: TurnExecutionResult,
@@ -48,9 +53,9 @@ class GameStateManager:
 
     def rebuild_game_state(self, session_id: str, round_number: int):
         """重建遊戲狀態"""
-        setup_data = self.setup_repo.get_by_session_id(session_id)
+        platforms_info = self.setup_repo.get_platforms_by_session_id(session_id)
         platform_states = self.state_repo.get_by_session_and_round(session_id, round_number)
-        return self.game_state_logic.rebuild_game_from_db(session_id, round_number, setup_data, platform_states)
+        return self.game_state_logic.rebuild_game_from_db(session_id, round_number, platforms_info, platform_states)
     
     def evaluate_and_apply_effects(
         self, 
@@ -69,11 +74,12 @@ class GameStateManager:
             turn_result.simulated_comments
         )
         
-        logger.debug(f"Original GM evaluation for {turn_result.actor}", extra={
-            "session_id": turn_result.session_id, 
-            "round": turn_result.round_number, 
-            "gm_result": original_gm_result.model_dump()
-        })
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(f"Original GM evaluation for {turn_result.actor}", extra={
+                "session_id": turn_result.session_id, 
+                "round": turn_result.round_number, 
+                "gm_result": original_gm_result.model_dump()
+            })
         
         # 2. 應用工具效果
         final_gm_result = original_gm_result
@@ -100,20 +106,53 @@ class GameStateManager:
         
         return GameTurnResult(turn_result, final_gm_result, tool_effects)
     
-    def persist_turn_result(self, game_turn_result: GameTurnResult) -> int:
-        """持久化回合結果，返回 action_id"""
+    def _validate_platform_names(
+        self, session_id: str, round_number: int, gm_result: GameMasterAgentResponse
+    ) -> None:
+        """
+        確認 GM 評估中的每個平台都屬於本局設定。
+
+        Raises:
+            ResourceNotFoundError: 有任何平台名稱不在本局平台之中
+        """
+        known_names = {p["name"] for p in self.setup_repo.get_platforms_by_session_id(session_id)}
+        unknown_names = [
+            state.platform_name for state in gm_result.platform_status
+            if state.platform_name not in known_names
+        ]
+        if unknown_names:
+            raise ResourceNotFoundError(
+                message=f"PlatformState not found for platforms {unknown_names} of session={session_id}, round={round_number}",
+                resource_type="platform_state",
+                resource_id=f"{session_id}-{round_number}"
+            )
+    
+    def persist_turn_result(self, game_turn_result: GameTurnResult, db: Session) -> int:
+        """
+        持久化回合結果，返回 action_id。
+        寫入併入呼叫端的交易，由呼叫端負責提交。
+        """
         turn_result = game_turn_result.turn_result
         gm_result = game_turn_result.gm_evaluation
         
-        # 1. 記錄行動
+        # GM 回傳的平台名稱來自 LLM，寫入前先比對本局平台，避免批次 UPDATE 靜默略過
+        self._validate_platform_names(turn_result.session_id, turn_result.round_number, gm_result)
+        
+        # 所有寫入使用呼叫端的 session，交易與提交由應用層負責
+        # 1. 記錄行動（GM 評估結果已知，隨 INSERT 一併寫入，不再另外 UPDATE）
         action_record = self.action_repo.create_action_record(
             session_id=turn_result.session_id,
             round_number=turn_result.round_number,
             actor=turn_result.actor,
             platform=turn_result.target_platform,
             content=turn_result.article.content,
-            simulated_comments=turn_result.simulated_comments
-            )
+            reach_count=gm_result.reach_count,
+            trust_change=gm_result.trust_change,
+            spread_change=gm_result.spread_change,
+            effectiveness=gm_result.effectiveness,
+            simulated_comments=turn_result.simulated_comments,
+            db=db
+        )
         
         # 紀錄潤飾前後的文章
         if turn_result.article.polished_content:
@@ -121,42 +160,40 @@ class GameStateManager:
                 session_id=turn_result.session_id,
                 round_number=turn_result.round_number,
                 original_content=turn_result.article.content,
-                polished_content=turn_result.article.polished_content
+                polished_content=turn_result.article.polished_content,
+                db=db
             )
-
-        # 2. 更新行動效果
-        self.action_repo.update_effectiveness(
-            action_id=action_record.id,
-            trust_change=gm_result.trust_change,
-            spread_change=gm_result.spread_change,
-            reach_count=gm_result.reach_count,
-            effectiveness=gm_result.effectiveness,
-        )
         
-        # 3. 更新平台狀態
-        for state in gm_result.platform_status:
-            self.state_repo.update_platform_state(
-                session_id=turn_result.session_id,
-                round_number=turn_result.round_number,
-                platform_name=state.platform_name,
-                player_trust=state.player_trust,
-                ai_trust=state.ai_trust,
-                spread_rate=state.spread_rate
-            )
+        # 2. 更新平台狀態（所有平台一次批次 UPDATE）
+        self.state_repo.update_all_platforms_states(
+            session_id=turn_result.session_id,
+            round_number=turn_result.round_number,
+            platform_status_list=[
+                {
+                    "platform_name": state.platform_name,
+                    "player_trust": state.player_trust,
+                    "ai_trust": state.ai_trust,
+                    "spread_rate": state.spread_rate
+                }
+                for state in gm_result.platform_status
+            ],
+            db=db
+        )
         
-        # 4. 記錄工具使用
+        # 3. 記錄工具使用
         for tool_effect in game_turn_result.tool_effects:
             if tool_effect.is_effective:
                 self.tool_usage_repo.create_tool_usage_record(
                     action_id=action_record.id,
-                    usage_detail=tool_effect
+                    usage_detail=tool_effect,
+                    db=db
                 )
                 logger.debug(f"Recorded tool usage: {tool_effect.tool_name}", extra={
                     "session_id": turn_result.session_id,
                     "action_id": action_record.id
                 })
         
-        # 5. 標記玩家回合完成
+        # 4. 標記玩家回合完成
         if turn_result.actor == "player":
             # 這個邏輯應該由上層的 round_repo 處理，但為了保持一致性暫時放在這裡
             pass
@@ -197,10 +234,16 @@ class GameStateManager:
         """獲取適用的工具列表"""
         domain_tools = []
         
+        # 一次取回該行動者可用的工具並建立索引（名稱不區分大小寫），避免每個工具各查一次資料庫
+        tools_by_name = {
+            tool.tool_name.lower(): tool
+            for tool in tool_repo.list_tools_for_actor(actor)
+        }
+        
         for tool_dto in tools_used:
-            domain_tool = tool_repo.get_tool_by_name(tool_dto.tool_name)
+            domain_tool = tools_by_name.get(tool_dto.tool_name.lower())
             
-            if domain_tool and (domain_tool.applicable_to == actor or domain_tool.applicable_to == "both"):
+            if domain_tool:
                 domain_tools.append(domain_tool)
                 logger.debug(f"Tool '{tool_dto.tool_name}' applicable for {actor}", extra={
                     "session_id": session_id,
@@ -3,7 +3,7 @@
 """
 from typing import List, Dict, Any, Optional
 from src.application.dto.game_dto import (
-    ArticleMeta, PlatformStatus, AiTurnResponse, PlayerTurnResponse
+    ArticleMeta, PlatformStatus, AiTurnResponse, PlayerTurnResponse, ToolInfo
 )
 from src.domain.logic.game_state_manager import GameTurnResult
 from src.domain.logic.tool_availability_logic import ToolAvailabilityLogic
@@ -19,7 +19,7 @@ class ResponseConverter:
     def to_turn_response(
         self, 
         game_turn_result: GameTurnResult, 
-        tool_list: Optional[List[Dict[str, Any]]] = None,
+        tool_list: Optional[List[ToolInfo]] = None,
         game_end_result: Optional[Dict[str, Any]] = None,
         dashboard_info: Optional[Dict[str, Any]] = None
     ):
@@ -28,7 +28,7 @@ class ResponseConverter:
         gm_result = game_turn_result.gm_evaluation
         
         # 獲取平台設置信息
-        platforms_info = self.setup_repo.get_by_session_id(turn_result.session_id).platforms
+        platforms_info = self.setup_repo.get_platforms_by_session_id(turn_result.session_id)
         
         # 清理文章數據（移除敏感信息）
         article_safe = self._create_safe_article(turn_result.article, turn_result.actor)
@@ -76,24 +76,27 @@ class ResponseConverter:
     
     def _create_safe_article(self, article: ArticleMeta, actor: str) -> ArticleMeta:
         """創建安全的文章副本（移除敏感信息）"""
-        article_dict = article.model_dump()
-        
         # 移除真實性信息
-        article_dict["veracity"] = None
+        update = {"veracity": None}
         
         # AI 回合不顯示目標平台
         if actor == "ai":
-            article_dict["target_platform"] = None
+            update["target_platform"] = None
         
-        return ArticleMeta.model_validate(article_dict)
+        # 僅覆寫欄位，model_copy 不會重新序列化與驗證整篇文章
+        return article.model_copy(update=update)
     
-    def _convert_platform_status(self, platform_status_list) -> List[Dict[str, Any]]:
-        """轉換平台狀態列表"""
+    def _convert_platform_status(self, platform_status_list) -> List[PlatformStatus]:
+        """
+        轉換平台狀態列表。
+        欄位值來自已驗證的 GM 回應，直接以 model_construct 建立實例交給回應 DTO，
+        不再先驗證、轉成 dict 後由回應 DTO 再驗證一次。
+        """
         return [
-            PlatformStatus(
+            PlatformStatus.model_construct(
                 platform_name=ps.platform_name,
                 player_trust=ps.player_trust,
                 ai_trust=ps.ai_trust,
                 spread_rate=ps.spread_rate
-            ).model_dump() for ps in platform_status_list
+            ) for ps in platform_status_list
         ]
@@ -1,5 +1,17 @@
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
-from src.application.dto.game_dto import SimulateCommentsRequest, SimulateCommentsResponse
+from src.application.dto.game_dto import ArticleMeta, SimulateCommentsResponse
+
+
+@dataclass(slots=True, frozen=True)
+class SimulateCommentsRequest:
+    """群眾留言生成請求（僅供回合執行內部使用，資料皆已驗證，不需經過 Pydantic）"""
+    session_id: str
+    article: ArticleMeta
+    actor: str
+    round_number: int
+    platform: str
+    audience: Optional[str] = None
 
 class SimulateCommentsLogic:
     """
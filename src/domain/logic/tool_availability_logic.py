@@ -2,6 +2,7 @@
 工具可用性邏輯 - 根據遊戲回合判斷可用工具
 完全基於資料庫 available_from_round 欄位進行判斷，支援快取
 """
+import logging
 from typing import List, Dict, Any, Optional, Tuple
 from src.infrastructure.database.tool_repo import ToolRepository
 from src.domain.models.game import Game
@@ -114,7 +115,8 @@ class ToolAvailabilityLogic:
             }
             tool_list.append(tool_dict)
         
-        logger.debug(f"第 {round_number} 回合 {actor} 可用工具: {[t['tool_name'] for t in tool_list]}")
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(f"第 {round_number} 回合 {actor} 可用工具: {[t['tool_name'] for t in tool_list]}")
         return tool_list
     
     def get_all_available_tools_info(self, actor: str = "player", use_cache: bool = True) -> Dict[str, Any]:
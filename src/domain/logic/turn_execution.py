@@ -2,13 +2,19 @@
 回合執行邏輯 - 負責處理 AI 和玩家的行動執行
 """
 from typing import Dict, Any, Optional, List
-from src.application.dto.game_dto import ArticleMeta, ToolUsed, FakeNewsAgentResponse, SimulateCommentsRequest
+from src.application.dto.game_dto import ArticleMeta, ToolUsed, FakeNewsAgentResponse
+from src.domain.logic.simulate_comments import SimulateCommentsRequest
 from src.domain.models.game import Game
 from src.utils.logger import logger
 
 
 class TurnExecutionResult:
     """回合執行結果的統一數據結構"""
+    __slots__ = (
+        "actor", "session_id", "round_number", "article",
+        "target_platform", "tools_used", "agent_response", "simulated_comments"
+    )
+
     def __init__(
         self,
         actor: str,
@@ -77,8 +83,7 @@ class TurnExecutionLogic:
         selected_platform = self.ai_turn_logic.select_platform(game.platforms)
         
         # 獲取新聞來源
-        news_1 = self.news_repo.get_random_active_news()
-        news_2 = self.news_repo.get_random_active_news()
+        news_1, news_2 = self.news_repo.get_random_active_news_batch(2)
         
         # 準備變數
         variables = self.ai_turn_logic.prepare_fake_news_variables(
@@ -163,7 +168,7 @@ class TurnExecutionLogic:
         if not target_platform:
             available_platforms = [p.name for p in game.platforms]
             target_platform = available_platforms[0] if available_platforms else "Facebook"
-            article.target_platform = target_platform
+            article = article.model_copy(update={"target_platform": target_platform})
             
             logger.warning(f"Player article missing target_platform, defaulting to {target_platform}")
         
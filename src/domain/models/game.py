@@ -1,8 +1,15 @@
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
-@dataclass
+# 行動者對應的信任值欄位
+_TRUST_FIELD_BY_ACTOR = MappingProxyType({
+    "player": "player_trust",
+    "ai": "ai_trust"
+})
+
+@dataclass(slots=True)
 class SessionId:
     value: str
     
@@ -10,7 +17,7 @@ class SessionId:
         if not self.value or not self.value.startswith('game_'):
             raise ValueError("Invalid session ID format")
 
-@dataclass
+@dataclass(slots=True)
 class TrustScore:
     value: int
     
@@ -22,7 +29,7 @@ class TrustScore:
         new_value = max(0, min(100, self.value + change))
         return TrustScore(new_value)
 
-@dataclass
+@dataclass(slots=True)
 class SpreadRate:
     value: int
     
@@ -34,7 +41,7 @@ class SpreadRate:
         new_value = max(0, min(100, self.value + change))
         return SpreadRate(new_value)
 
-@dataclass
+@dataclass(slots=True)
 class Platform:
     name: str
     audience: str
@@ -43,15 +50,14 @@ class Platform:
     spread_rate: SpreadRate
     
     def apply_trust_change(self, actor: str, change: int) -> None:
-        if actor == "player":
-            self.player_trust = self.player_trust.apply_change(change)
-        elif actor == "ai":
-            self.ai_trust = self.ai_trust.apply_change(change)
+        field_name = _TRUST_FIELD_BY_ACTOR.get(actor)
+        if field_name:
+            setattr(self, field_name, getattr(self, field_name).apply_change(change))
     
     def apply_spread_change(self, change: int) -> None:
         self.spread_rate = self.spread_rate.apply_change(change)
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     title: str
     content: str
@@ -64,17 +70,17 @@ class Article:
     requirement: Optional[str] = None
     veracity: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ToolUsed:
     tool_name: str
     description: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class PlayerAction:
     article: Article
     tools_used: List[ToolUsed]
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     trust_change: int
     reach_count: int
@@ -82,7 +88,7 @@ class ActionResult:
     effectiveness: str
     simulated_comments: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     session_id: SessionId
     current_round: int
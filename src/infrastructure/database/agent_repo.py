@@ -4,13 +4,28 @@ Provides synchronous CRUD operations for Agent entities.
 """
 from typing import Optional, Dict, Any, List, Union
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from src.infrastructure.database.utils import with_session
+from src.infrastructure.database.utils import with_session, iso_timestamp
 
 from src.infrastructure.database.base_repo import BaseRepository
 from src.infrastructure.database.models.agent import Agent
 from src.utils.exceptions import ResourceNotFoundError
 
+# Agent 響應所需欄位的投影查詢（不含 instruction 等大型文字欄位），
+# 時間欄位於資料庫端格式化為 ISO 字串
+_AGENT_SUMMARY_STMT = select(
+    Agent.id,
+    Agent.agent_name,
+    Agent.provider,
+    Agent.model_name,
+    Agent.description,
+    Agent.tools,
+    Agent.temperature,
+    iso_timestamp(Agent.created_at).label("created_at"),
+    iso_timestamp(Agent.updated_at).label("updated_at"),
+)
+
 class AgentRepository(BaseRepository[Agent]):
     """
     Agent 資料庫 Repository 類，提供對 Agent 實體的基本 CRUD 操作。
@@ -120,3 +135,55 @@ class AgentRepository(BaseRepository[Agent]):
         
         # 調用父類的 create 方法
         return self.create(agent_data, db=db)
+    
+    @with_session
+    def list_summaries(self, db: Optional[Session] = None) -> List[Dict[str, Any]]:
+        """
+        以單一投影查詢取得所有 Agent 的列表欄位，直接返回 dict 而不建立 ORM 實體。
+        
+        Args:
+            db: 可選的數據庫 Session，如果未提供則自動創建
+            
+        Returns:
+            每個 Agent 一筆的欄位字典列表，欄位與 AgentResponse 相同
+        """
+        return [dict(row) for row in db.execute(_AGENT_SUMMARY_STMT).mappings()]
+    
+    @with_session
+    def get_summary_by_id(self, agent_id: int, db: Optional[Session] = None) -> Dict[str, Any]:
+        """
+        以投影查詢取得單一 Agent 的響應欄位，直接返回 dict 而不建立 ORM 實體。
+        
+        Args:
+            agent_id: Agent ID
+            db: 可選的數據庫 Session，如果未提供則自動創建
+            
+        Returns:
+            欄位與 AgentResponse 相同的字典
+            
+        Raises:
+            ResourceNotFoundError: 如果找不到 Agent
+        """
+        row = db.execute(_AGENT_SUMMARY_STMT.where(Agent.id == agent_id)).mappings().first()
+        if row is None:
+            raise ResourceNotFoundError(
+                message=f"Agent with primary key {agent_id} not found",
+                resource_type="agent",
+                resource_id=str(agent_id)
+            )
+        return dict(row)
+    
+    @with_session
+    def get_summary_by_name(self, agent_name: str, db: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        """
+        以投影查詢依名稱取得單一 Agent 的響應欄位。
+        
+        Args:
+            agent_name: Agent 名稱
+            db: 可選的數據庫 Session，如果未提供則自動創建
+            
+        Returns:
+            欄位與 AgentResponse 相同的字典，如果未找到則返回 None
+        """
+        row = db.execute(_AGENT_SUMMARY_STMT.where(Agent.agent_name == agent_name)).mappings().first()
+        return dict(row) if row is not None else None
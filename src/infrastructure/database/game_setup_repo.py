@@ -3,7 +3,8 @@ GameSetup repository for database operations.
 Provides synchronous CRUD operations for GameSetup entities.
 """
 
-from typing import Optional
+import threading
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 
 from src.infrastructure.database.base_repo import BaseRepository
@@ -11,6 +12,14 @@ from src.infrastructure.database.models.game_setup import GameSetup
 from src.infrastructure.database.utils import with_session
 from src.utils.exceptions import ResourceNotFoundError
 
+# 平台設定快取上限（場次數）
+_PLATFORMS_CACHE_MAXSIZE = 1024
+
+# 各場次的平台設定快取 {session_id: platforms}
+# 平台設定於開局時寫入後不再變動，因此只需限制容量，不需設定過期時間
+_platforms_cache: Dict[str, List[dict]] = {}
+_platforms_cache_lock = threading.Lock()
+
 
 class GameSetupRepository(BaseRepository[GameSetup]):
     """
@@ -22,6 +31,7 @@ class GameSetupRepository(BaseRepository[GameSetup]):
     
     # 查詢
     setup = repo.get_by_session_id("game123")
+    platforms = repo.get_platforms_by_session_id("game123")  # 程序內快取
     
     # 創建
     setup = repo.create_game_setup(
@@ -64,6 +74,35 @@ class GameSetupRepository(BaseRepository[GameSetup]):
             )
         return result[0]
 
+    def get_platforms_by_session_id(
+        self,
+        session_id: str,
+        db: Optional[Session] = None
+    ) -> List[dict]:
+        """
+        取得指定場次的平台與受眾設定，結果依 session_id 快取於程序內。
+
+        Args:
+            session_id: 遊戲識別碼
+            db: 可選的資料庫 Session（僅在快取未命中時使用）
+
+        Returns:
+            平台設定列表（[{"name": ..., "audience": ...}, ...]），呼叫端不應修改
+
+        Raises:
+            ResourceNotFoundError: 若未找到指定 session_id 對應的設定
+        """
+        platforms = _platforms_cache.get(session_id)
+        if platforms is not None:
+            return platforms
+
+        platforms = self.get_by_session_id(session_id, db=db).platforms
+        with _platforms_cache_lock:
+            if len(_platforms_cache) >= _PLATFORMS_CACHE_MAXSIZE:
+                _platforms_cache.pop(next(iter(_platforms_cache)))
+            _platforms_cache[session_id] = platforms
+        return platforms
+
     @with_session
     def create_game_setup(
         self,
@@ -3,7 +3,11 @@ News repository for database operations.
 Provides synchronous CRUD operations for News entities.
 """
 
-from typing import Optional, List
+import random
+import threading
+import time
+from typing import Dict, Optional, List, Tuple
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.infrastructure.database.base_repo import BaseRepository
@@ -11,6 +15,19 @@ from src.infrastructure.database.models.news import News
 from src.infrastructure.database.utils import with_session
 from src.utils.exceptions import ResourceNotFoundError
 
+# 新聞 ID 快取存活時間（秒）
+_NEWS_ID_CACHE_TTL = 300
+
+# 隨機抽選用的新聞 ID 快取 {active_only: (news_ids, timestamp)}
+_news_id_cache: Dict[bool, Tuple[List[int], float]] = {}
+_news_id_cache_lock = threading.Lock()
+
+
+def _clear_news_id_cache() -> None:
+    """清除新聞 ID 快取，於新增新聞後呼叫。"""
+    with _news_id_cache_lock:
+        _news_id_cache.clear()
+
 
 class NewsRepository(BaseRepository[News]):
     """
@@ -26,6 +43,9 @@ class NewsRepository(BaseRepository[News]):
     # 隨機取一筆啟用中的新聞
     news = repo.get_random_active_news()
 
+    # 一次隨機取兩筆啟用中的新聞
+    news_1, news_2 = repo.get_random_active_news_batch(2)
+
     # 創建新新聞資料
     new_news = repo.create_news(
         title="太陽能發電污染重？",
@@ -56,9 +76,7 @@ class NewsRepository(BaseRepository[News]):
         Raises:
             ResourceNotFoundError: 若查無任何啟用中的新聞
         """
-        from sqlalchemy.sql import func
-        stmt = db.query(News).filter(News.is_active.is_(True)).order_by(func.random()).limit(1)
-        result = stmt.first()
+        result = self._pick_random_news(active_only=True, db=db)
         if not result:
             raise ResourceNotFoundError(
                 message="No active news available.",
@@ -67,6 +85,34 @@ class NewsRepository(BaseRepository[News]):
             )
         return result
 
+    @with_session
+    def get_random_active_news_batch(
+        self,
+        count: int,
+        db: Optional[Session] = None
+    ) -> List[News]:
+        """
+        以單次查詢隨機取得多筆啟用中的新聞（可用新聞不足時允許重複）。
+
+        Args:
+            count: 要取得的新聞數量
+            db: 可選資料庫 Session
+
+        Returns:
+            News 實體列表，長度為 count
+
+        Raises:
+            ResourceNotFoundError: 若查無任何啟用中的新聞
+        """
+        results = self._pick_random_news_batch(active_only=True, count=count, db=db)
+        if not results:
+            raise ResourceNotFoundError(
+                message="No active news available.",
+                resource_type="news",
+                resource_id="active"
+            )
+        return results
+
     @with_session
     def create_news(
         self,
@@ -93,6 +139,7 @@ class NewsRepository(BaseRepository[News]):
         Returns:
             新創建的 News 實體
         """
+        _clear_news_id_cache()
         return self.create(
             {
                 "title": title,
@@ -119,9 +166,7 @@ class NewsRepository(BaseRepository[News]):
         Returns:
             隨機選取的 News 實體
         """
-        from sqlalchemy.sql import func
-        stmt = db.query(News).order_by(func.random()).limit(1)
-        result = stmt.first()
+        result = self._pick_random_news(active_only=False, db=db)
         if not result:
             raise ResourceNotFoundError(
                 message="No news available.",
@@ -129,3 +174,46 @@ class NewsRepository(BaseRepository[News]):
                 resource_id="random"
             )
         return result
+
+    def _get_news_ids(self, active_only: bool, db: Session, refresh: bool = False) -> List[int]:
+        """取得（並快取）可供抽選的新聞 ID 列表。"""
+        current_time = time.time()
+        cached = _news_id_cache.get(active_only)
+        if not refresh and cached is not None and current_time - cached[1] < _NEWS_ID_CACHE_TTL:
+            return cached[0]
+
+        stmt = select(News.news_id)
+        if active_only:
+            stmt = stmt.where(News.is_active.is_(True))
+        news_ids = list(db.scalars(stmt))
+
+        with _news_id_cache_lock:
+            _news_id_cache[active_only] = (news_ids, current_time)
+        return news_ids
+
+    def _pick_random_news(self, active_only: bool, db: Session) -> Optional[News]:
+        """隨機抽一則新聞，無可用新聞時回傳 None。"""
+        picked = self._pick_random_news_batch(active_only, 1, db)
+        return picked[0] if picked else None
+
+    def _pick_random_news_batch(self, active_only: bool, count: int, db: Session) -> List[News]:
+        """
+        從快取的 ID 列表隨機抽出 count 則，再以單一主鍵 IN 查詢取回，避免每次 ORDER BY RANDOM() 全表排序。
+        可用新聞不足 count 則時允許重複；快取過期前若抽到已刪除或已停用的新聞，重新載入 ID 列表再抽一次。
+        """
+        for refresh in (False, True):
+            news_ids = self._get_news_ids(active_only, db, refresh=refresh)
+            if not news_ids:
+                return []
+            if len(news_ids) >= count:
+                picked_ids = random.sample(news_ids, count)
+            else:
+                picked_ids = random.choices(news_ids, k=count)
+            news_by_id = {
+                news.news_id: news
+                for news in db.scalars(select(News).where(News.news_id.in_(set(picked_ids))))
+                if news.is_active or not active_only
+            }
+            if all(news_id in news_by_id for news_id in picked_ids):
+                return [news_by_id[news_id] for news_id in picked_ids]
+        return []
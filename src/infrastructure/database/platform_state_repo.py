@@ -5,6 +5,7 @@ Provides synchronous CRUD operations for PlatformState entities.
 
 from typing import List, Optional
 
+from sqlalchemy import bindparam, insert, update
 from sqlalchemy.orm import Session
 from src.infrastructure.database.utils import with_session
 
@@ -177,6 +178,7 @@ class PlatformStateRepository(BaseRepository[PlatformState]):
                 # 如果不是第一回合卻查不到上一回合，才 raise
                 raise
 
+        rows = []
         for platform in platforms:
             if "name" not in platform:
                 raise ValueError("Each platform must have a 'name' key.")
@@ -186,17 +188,18 @@ class PlatformStateRepository(BaseRepository[PlatformState]):
             platform_ai_trust = ai_trust if ai_trust is not None else (previous_state.ai_trust if previous_state else 50)
             platform_spread_rate = spread_rate if spread_rate is not None else (previous_state.spread_rate if previous_state else 50)
 
-            self.create(
-                {
-                    "session_id": session_id,
-                    "round_number": round_number,
-                    "platform_name": platform["name"],
-                    "player_trust": platform_player_trust,
-                    "ai_trust": platform_ai_trust,
-                    "spread_rate": platform_spread_rate,
-                },
-                db=db
-            )
+            rows.append({
+                "session_id": session_id,
+                "round_number": round_number,
+                "platform_name": platform["name"],
+                "player_trust": platform_player_trust,
+                "ai_trust": platform_ai_trust,
+                "spread_rate": platform_spread_rate,
+            })
+
+        # 所有平台以單一批次 INSERT 寫入，不逐筆 flush/refresh
+        if rows:
+            db.execute(insert(PlatformState), rows)
 
     @with_session
     def update_platform_state(
@@ -240,7 +243,8 @@ class PlatformStateRepository(BaseRepository[PlatformState]):
         platform.player_trust = player_trust
         platform.ai_trust = ai_trust
         platform.spread_rate = spread_rate
-        db.commit()
+        # 由 with_session（或呼叫端的交易）負責提交，這裡只送出 UPDATE
+        db.flush()
 
     
     @with_session    
@@ -252,19 +256,49 @@ class PlatformStateRepository(BaseRepository[PlatformState]):
         db: Optional[Session] = None
     ):
         """
-        批次更新所有平台狀態。
+        批次更新所有平台狀態，以單一 executemany UPDATE 送出。
         platform_status_list: [
-            {"platform_name": ..., "ai_trust": ..., "spread": ...},
+            {"platform_name": ..., "player_trust": ..., "ai_trust": ..., "spread_rate": ...},
             ...
         ]
+
+        Raises:
+            ResourceNotFoundError: 如果有任何平台找不到對應的 PlatformState
         """
-        for state in platform_status_list:
-            self.update_platform_state(
-                session_id=session_id,
-                round_number=round_number,
-                platform_name=state["platform_name"],
-                ai_trust=state["ai_trust"],
-                spread_rate=state["spread"],
-                db=db
+        if not platform_status_list:
+            return
+
+        # 以 Core 層的資料表執行（ORM 的批次 UPDATE 僅支援以主鍵比對）
+        table = PlatformState.__table__
+        result = db.execute(
+            update(table)
+            .where(
+                table.c.session_id == session_id,
+                table.c.round_number == round_number,
+                table.c.platform_name == bindparam("b_platform_name"),
+            )
+            .values(
+                player_trust=bindparam("b_player_trust"),
+                ai_trust=bindparam("b_ai_trust"),
+                spread_rate=bindparam("b_spread_rate"),
+            ),
+            [
+                {
+                    "b_platform_name": state["platform_name"],
+                    "b_player_trust": state["player_trust"],
+                    "b_ai_trust": state["ai_trust"],
+                    "b_spread_rate": state["spread_rate"],
+                }
+                for state in platform_status_list
+            ]
+        )
+
+        # psycopg2 等驅動無法回報 executemany 的影響筆數，此檢查僅為輔助；
+        # 平台名稱須由呼叫端（GameStateManager）先行比對本局平台
+        if result.supports_sane_multi_rowcount() and result.rowcount != len(platform_status_list):
+            raise ResourceNotFoundError(
+                message=f"PlatformState not found for some platforms of session={session_id}, round={round_number}",
+                resource_type="platform_state",
+                resource_id=f"{session_id}-{round_number}"
             )
 
@@ -2,18 +2,45 @@
 Database connection management module.
 Provides synchronous database session management.
 """
-from typing import Generator
+import itertools
+import threading
+from contextvars import ContextVar
+from typing import Any, Generator, Hashable, Optional
+
+import orjson
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
 
 from src.config import settings
 
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson (non-str keys coerced like json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create synchronous engine
+# pool_pre_ping: drop connections the server has closed before handing them out
+# pool_recycle: proactively replace connections older than the given seconds
+# pool_timeout: fail fast instead of hanging forever when the pool is exhausted
+# pool_use_lifo: reuse the most recently returned connection so a few warm
+#   connections serve steady traffic and idle extras can age out via pool_recycle
+# query_cache_size: room for every repository statement shape (default 500) so
+#   compiled SQL is reused instead of being evicted and recompiled under load
+# json_serializer / json_deserializer: JSON columns (platforms, tools,
+#   simulated_comments...) go through orjson instead of the stdlib json module
 engine = create_engine(
     settings.database_url_sync,  
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_use_lifo=True,
+    query_cache_size=1200,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create synchronous session factory
@@ -24,6 +51,27 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+# Request-scoped session registry.
+# DBSessionMiddleware sets request_scope once per HTTP request; the value is
+# copied into the threadpool that runs sync routes and dependencies, so every
+# ScopedSession() call within one request returns the same session. Outside a
+# request (scripts, tests) the scope falls back to the current thread.
+request_scope: ContextVar[Optional[int]] = ContextVar("request_scope", default=None)
+_request_ids = itertools.count()
+
+
+def next_request_scope() -> int:
+    """Return a new, process-unique request scope id."""
+    return next(_request_ids)
+
+
+def _current_scope() -> Hashable:
+    scope = request_scope.get()
+    return scope if scope is not None else ("thread", threading.get_ident())
+
+
+ScopedSession = scoped_session(SessionLocal, scopefunc=_current_scope)
+
 def get_db() -> Generator[Session, None, None]:
     """
     Provide a synchronous database session dependency.
@@ -3,8 +3,13 @@
 提供資料庫操作的輔助功能。
 """
 import functools
+from contextlib import contextmanager
 from typing import TypeVar, Callable, Any, Optional
+from sqlalchemy import DateTime, String, case, func
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import TypeDecorator
 
 from src.infrastructure.database.session import get_db
 
@@ -64,6 +69,7 @@ def with_session(func: Callable[..., T]) -> Callable[..., T]:
     
     return wrapper
 
+@contextmanager
 def manage_session(db: Optional[Session] = None):
     """
     上下文管理器函數：提供一個可在 with 中使用的 session 管理器。
@@ -102,4 +108,51 @@ def manage_session(db: Optional[Session] = None):
         raise
     finally:
         # 總是關閉自己創建的 session
-        session.close()
\ No newline at end of file
+        session.close()
+
+
+class _IsoTimestampType(TypeDecorator):
+    """iso_timestamp 的結果型別：PostgreSQL 為字串，其他方言為原始時間欄位"""
+    impl = String
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(DateTime())
+
+
+class iso_timestamp(FunctionElement):
+    """
+    將時間欄位於資料庫端格式化為 ISO 8601 字串，結果與 `datetime.isoformat()` 相同：
+    微秒為 0 時省略小數部分（YYYY-MM-DDTHH:MI:SS），否則為 YYYY-MM-DDTHH:MI:SS.ffffff。
+    
+    PostgreSQL 以 to_char 在查詢中完成格式化，結果直接為字串；其他方言（如測試用的
+    SQLite）回傳原始時間欄位，由呼叫端自行以 isoformat() 格式化。
+    僅適用於不含時區的時間欄位。
+    
+    用法：
+    ```python
+    stmt = select(Agent.id, iso_timestamp(Agent.created_at).label("created_at"))
+    ```
+    """
+    type = _IsoTimestampType()
+    inherit_cache = True
+
+
+@compiles(iso_timestamp)
+def _compile_iso_timestamp(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(iso_timestamp, "postgresql")
+def _compile_iso_timestamp_postgresql(element, compiler, **kw):
+    (column,) = element.clauses.clauses
+    # 與 isoformat() 一致：整秒時不輸出 .000000
+    fraction = case(
+        (func.date_trunc("second", column) == column, ""),
+        else_=func.to_char(column, ".US"),
+    )
+    return compiler.process(
+        func.to_char(column, 'YYYY-MM-DD"T"HH24:MI:SS').concat(fraction), **kw
+    )
@@ -0,0 +1,60 @@
+"""
+遊戲 DTO 驗證測試
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from src.application.dto.game_dto import PlayerTurnRequest, ToolInfo
+
+
+def _player_turn_payload(tool_list):
+    return {
+        "session_id": "game_test",
+        "round_number": 1,
+        "article": {
+            "title": "標題",
+            "content": "內容",
+            "author": "player",
+            "published_date": "2024-05-18T15:30:00"
+        },
+        "tool_used": [],
+        "tool_list": tool_list
+    }
+
+
+class TestPlayerTurnRequestToolList:
+    """測試玩家回合請求的 tool_list 在寫入前即完成驗證"""
+
+    def setup_method(self):
+        """設置只驗證請求本體的測試端點"""
+        app = FastAPI()
+
+        @app.post("/player-turn")
+        def player_turn(request: PlayerTurnRequest):
+            return {"ok": True}
+
+        self.client = TestClient(app)
+
+    def test_partial_tool_list_rejected_with_422(self):
+        """測試缺少 tool_name 的工具項目以 422 拒絕"""
+        response = self.client.post(
+            "/player-turn", json=_player_turn_payload([{"name": "事實查核"}])
+        )
+
+        assert response.status_code == 422
+
+    def test_partial_tool_list_fails_validation(self):
+        """測試缺少 tool_name 的工具項目無法建立請求 DTO"""
+        with pytest.raises(ValidationError):
+            PlayerTurnRequest(**_player_turn_payload([{"description": "查核新聞真偽"}]))
+
+    def test_tool_list_parsed_as_tool_info(self):
+        """測試完整的工具項目轉為 ToolInfo"""
+        request = PlayerTurnRequest(**_player_turn_payload([
+            {"tool_name": "事實查核", "description": "查核新聞真偽", "trust_effect": 1.2}
+        ]))
+
+        assert request.tool_list == [
+            ToolInfo(tool_name="事實查核", description="查核新聞真偽", trust_effect=1.2)
+        ]
@@ -0,0 +1,133 @@
+"""
+遊戲狀態管理邏輯的單元測試
+"""
+import pytest
+from unittest.mock import Mock
+from src.application.dto.game_dto import (
+    ArticleMeta, GameMasterAgentPlatformStatus, GameMasterAgentResponse, ToolUsed
+)
+from src.domain.logic.game_state_manager import GameStateManager, GameTurnResult
+from src.domain.logic.turn_execution import TurnExecutionResult
+from src.domain.models.tool import DomainTool, ToolEffect
+from src.utils.exceptions import ResourceNotFoundError
+
+
+class TestGetApplicableTools:
+    """測試工具適用性判斷"""
+    
+    def setup_method(self):
+        """設置測試環境"""
+        self.mock_tool_repo = Mock()
+        self.mock_tool_repo.list_tools_for_actor.return_value = [
+            DomainTool(
+                tool_name="事實查核",
+                description="查核新聞真偽",
+                applicable_to="player",
+                effects=ToolEffect(trust_multiplier=1.2, spread_multiplier=1.0)
+            ),
+            DomainTool(
+                tool_name="AI文案優化",
+                description="使用AI優化文章的說服力和清晰度",
+                applicable_to="both",
+                effects=ToolEffect(trust_multiplier=1.1, spread_multiplier=1.1)
+            ),
+        ]
+        self.manager = GameStateManager(
+            setup_repo=Mock(), state_repo=Mock(), action_repo=Mock(), tool_usage_repo=Mock(),
+            game_state_logic=Mock(), gm_logic=Mock(), tool_effect_logic=Mock(),
+            agent_factory=Mock(), polish_repo=Mock()
+        )
+    
+    def test_tools_resolved_with_single_query(self):
+        """測試多個工具只查詢一次資料庫"""
+        tools_used = [ToolUsed(tool_name="事實查核"), ToolUsed(tool_name="AI文案優化")]
+        
+        result = self.manager._get_applicable_tools(
+            tools_used, "player", self.mock_tool_repo, "game_test", 1
+        )
+        
+        assert [t.tool_name for t in result] == ["事實查核", "AI文案優化"]
+        self.mock_tool_repo.list_tools_for_actor.assert_called_once_with("player")
+        self.mock_tool_repo.get_tool_by_name.assert_not_called()
+    
+    def test_tool_name_case_insensitive(self):
+        """測試工具名稱比對不區分大小寫"""
+        result = self.manager._get_applicable_tools(
+            [ToolUsed(tool_name="ai文案優化")], "player", self.mock_tool_repo, "game_test", 1
+        )
+        
+        assert [t.tool_name for t in result] == ["AI文案優化"]
+    
+    def test_unknown_tool_skipped(self):
+        """測試不存在或不適用的工具會被略過"""
+        result = self.manager._get_applicable_tools(
+            [ToolUsed(tool_name="不存在的工具")], "player", self.mock_tool_repo, "game_test", 1
+        )
+        
+        assert result == []
+
+
+class TestPersistTurnResult:
+    """測試回合結果持久化前的平台名稱檢查"""
+    
+    def setup_method(self):
+        """設置測試環境"""
+        self.mock_setup_repo = Mock()
+        self.mock_setup_repo.get_platforms_by_session_id.return_value = [
+            {"name": "Facebook", "audience": "年輕族群"},
+            {"name": "Instagram", "audience": "中年族群"},
+            {"name": "Thread", "audience": "老年族群"},
+        ]
+        self.mock_state_repo = Mock()
+        self.mock_action_repo = Mock()
+        self.mock_action_repo.create_action_record.return_value = Mock(id=1)
+        self.manager = GameStateManager(
+            setup_repo=self.mock_setup_repo, state_repo=self.mock_state_repo,
+            action_repo=self.mock_action_repo, tool_usage_repo=Mock(),
+            game_state_logic=Mock(), gm_logic=Mock(), tool_effect_logic=Mock(),
+            agent_factory=Mock(), polish_repo=Mock()
+        )
+    
+    def _make_turn_result(self, platform_names):
+        turn_result = TurnExecutionResult(
+            actor="ai",
+            session_id="game_test",
+            round_number=1,
+            article=ArticleMeta(
+                title="標題", content="內容", author="ai", published_date="2024-05-18T15:30:00"
+            ),
+            target_platform="Facebook",
+            tools_used=[]
+        )
+        gm_result = GameMasterAgentResponse(
+            trust_change=-5,
+            spread_change=10,
+            reach_count=100,
+            platform_status=[
+                GameMasterAgentPlatformStatus(
+                    platform_name=name, player_trust=50, ai_trust=50, spread_rate=50
+                )
+                for name in platform_names
+            ],
+            effectiveness="medium",
+            simulated_comments=[]
+        )
+        return GameTurnResult(turn_result, gm_result, [])
+    
+    def test_unknown_platform_raises_before_write(self):
+        """測試 GM 回傳不屬於本局的平台名稱時拋出例外且不寫入資料庫"""
+        game_turn_result = self._make_turn_result(["Facebook", "instagram", "Thread"])
+        
+        with pytest.raises(ResourceNotFoundError):
+            self.manager.persist_turn_result(game_turn_result, db=Mock())
+        
+        self.mock_action_repo.create_action_record.assert_not_called()
+        self.mock_state_repo.update_all_platforms_states.assert_not_called()
+    
+    def test_known_platforms_updated_in_one_call(self):
+        """測試平台名稱皆正確時以一次批次更新寫入"""
+        game_turn_result = self._make_turn_result(["Facebook", "Instagram", "Thread"])
+        
+        self.manager.persist_turn_result(game_turn_result, db=Mock())
+        
+        self.mock_state_repo.update_all_platforms_states.assert_called_once()
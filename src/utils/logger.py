@@ -4,7 +4,7 @@
 import logging
 import sys
 import os
-import json
+import orjson
 from typing import Any, Dict, Optional
 from src.config import settings
 
@@ -66,35 +66,45 @@ class Logger:
                 file_handler.setFormatter(file_formatter)
                 self.logger.addHandler(file_handler)
     
+    def is_enabled_for(self, level: int) -> bool:
+        """檢查指定級別是否會輸出，供呼叫端在組裝昂貴的日誌內容前判斷"""
+        return self.logger.isEnabledFor(level)
+    
     def _format_log(self, message: str, extra: Optional[Dict[str, Any]] = None) -> str:
         """格式化日誌訊息，可選添加額外資訊"""
         if extra:
-            return f"{message} | {json.dumps(extra, ensure_ascii=False)}"
+            return f"{message} | {orjson.dumps(extra, option=orjson.OPT_NON_STR_KEYS).decode()}"
         return message
     
     def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """記錄 INFO 級別的日誌"""
-        self.logger.info(self._format_log(message, extra))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format_log(message, extra))
 
     def error(self, message: str, extra: Optional[Dict[str, Any]] = None, exc_info=False) -> None:
         """記錄 ERROR 級別的日誌, 可選包含異常訊息"""
-        self.logger.error(self._format_log(message, extra), exc_info=exc_info)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(self._format_log(message, extra), exc_info=exc_info)
 
     def warning(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """記錄 WARNING 級別的日誌"""
-        self.logger.warning(self._format_log(message, extra))
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(self._format_log(message, extra))
     
     def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """記錄 DEBUG 級別的日誌"""
-        self.logger.debug(self._format_log(message, extra))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format_log(message, extra))
     
     def critical(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """記錄 CRITICAL 級別的日誌"""
-        self.logger.critical(self._format_log(message, extra))
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(self._format_log(message, extra))
     
     def exception(self, message: str, exc_info=True, extra: Optional[Dict[str, Any]] = None) -> None:
         """記錄異常訊息"""
-        self.logger.exception(self._format_log(message, extra), exc_info=exc_info)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.exception(self._format_log(message, extra), exc_info=exc_info)
 
 # 創建全局 logger 實例
 logger = Logger()
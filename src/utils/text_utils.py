@@ -1,7 +1,15 @@
 import re
 
+_CODE_BLOCK_OPEN = re.compile(r"^```[a-zA-Z]*\n")
+_CODE_BLOCK_CLOSE = re.compile(r"\n?```$")
+# 移除全形空白與不換行空白
+_SPACE_REMOVAL_TABLE = str.maketrans("", "", "\u3000\xa0")
+
 def strip_code_block_and_space(text: str) -> str:
-    cleaned = re.sub(r"^```[a-zA-Z]*\n", "", text)
-    cleaned = re.sub(r"\n?```$", "", cleaned)
-    cleaned = cleaned.strip().replace('\u3000', '').replace('\xa0', '')
-    return cleaned
\ No newline at end of file
+    cleaned = text
+    # 沒有 code fence 的回應（最常見）不需進入正則
+    if "```" in cleaned:
+        cleaned = _CODE_BLOCK_OPEN.sub("", cleaned)
+        cleaned = _CODE_BLOCK_CLOSE.sub("", cleaned)
+    cleaned = cleaned.strip().translate(_SPACE_REMOVAL_TABLE)
+    return cleaned
@@ -2,9 +2,19 @@
 模板處理服務 - 處理模板字符串和變數替換
 """
 import re
-import json
 from typing import Dict, Any
 
+import orjson
+
+# 變數佔位符樣式於模組載入時編譯一次，所有渲染呼叫共用
+_DOUBLE_BRACE_PATTERN = re.compile(r'{{([^{}]+)}}')
+_SINGLE_BRACE_PATTERN = re.compile(r'{([^{}]+)}')
+
+
+def _dump_json(value: Any) -> str:
+    """將 dict / list 變數轉為縮排 2 格的 JSON 字串（格式同 json.dumps(indent=2, ensure_ascii=False)）"""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
 class VariablesRenderer:
     """處理模板字符串和變數替換"""
     
@@ -30,35 +40,31 @@ class VariablesRenderer:
             return text
             
         # 先處理雙大括號格式 {{variable}}
-        double_pattern = r'{{([^{}]+)}}'
-        
         def replace_double_var(match):
             var_name = match.group(1).strip()
             value = variables.get(var_name)
             
             # 特殊處理某些類型的值
             if isinstance(value, (dict, list)):
-                return json.dumps(value, indent=2, ensure_ascii=False)
+                return _dump_json(value)
             
             # 返回字符串形式的值，如果變數不存在則保留原佔位符
             return str(value) if value is not None else f"{{{{{var_name}}}}}"
         
         # 替換所有匹配的雙大括號變數
-        result = re.sub(double_pattern, replace_double_var, text)
+        result = _DOUBLE_BRACE_PATTERN.sub(replace_double_var, text)
         
         # 再處理單大括號格式 {variable}
-        single_pattern = r'{([^{}]+)}'
-        
         def replace_single_var(match):
             var_name = match.group(1).strip()
             value = variables.get(var_name)
             
             # 特殊處理某些類型的值
             if isinstance(value, (dict, list)):
-                return json.dumps(value, indent=2, ensure_ascii=False)
+                return _dump_json(value)
             
             # 返回字符串形式的值，如果變數不存在則保留原佔位符
             return str(value) if value is not None else f"{{{var_name}}}"
         
         # 替換所有匹配的單大括號變數
-        return re.sub(single_pattern, replace_single_var, result)
+        return _SINGLE_BRACE_PATTERN.sub(replace_single_var, result)